@@ -13,6 +13,7 @@ __all__ = (  # noqa: F405
     "CONTROL_CHARS",
     "ALL_RESTRICTED_CHARS",
     "UNICODE_CHAR_MAP",
+    "UNICODE_TRANSLATE_TABLE",
     "UNICODE_DOT_REPLACEMENT",
     "UNICODE_SPACE_REPLACEMENT",
     "DEFAULT_MAX_NAME_LENGTH",
@@ -24,11 +25,13 @@ __all__ = (  # noqa: F405
     "RenameResult",
     # Scanner functions
     "build_rename_plan",
+    "iter_rename_actions",
     "validate_path_under_root",
     # Renamer functions
     "execute_plan",
     "format_plan_summary",
     "generate_log_filename",
+    "iter_plan_summary",
     "write_rename_log",
     # TUI
     "tui_main",
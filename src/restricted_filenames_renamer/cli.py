@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
-from .renamer import execute_plan, format_plan_summary, generate_log_filename
+from .renamer import LogFormat, execute_plan, generate_log_filename, iter_plan_summary
 from .sanitizer import ALL_RESTRICTED_CHARS, DEFAULT_MAX_NAME_LENGTH
 from .scanner import build_rename_plan
 
@@ -54,7 +55,10 @@ def create_parser() -> argparse.ArgumentParser:
         "--max-length",
         type=int,
         default=DEFAULT_MAX_NAME_LENGTH,
-        help=f"Maximum filename length before truncation (default: {DEFAULT_MAX_NAME_LENGTH}).",
+        help=(
+            "Maximum filename length before truncation, in UTF-8 bytes (characters on "
+            f"Windows) (default: {DEFAULT_MAX_NAME_LENGTH})."
+        ),
     )
     parser.add_argument(
         "--follow-symlinks",
@@ -68,6 +72,15 @@ def create_parser() -> argparse.ArgumentParser:
         default=None,
         help="Custom path for the JSON rename log. Default: rename_log_<timestamp>.json",
     )
+    parser.add_argument(
+        "--log-format",
+        choices=["json", "ndjson"],
+        default="json",
+        help=(
+            "Layout of the rename log: a single JSON document (default) or "
+            "newline-delimited JSON with one record per rename."
+        ),
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -98,11 +111,12 @@ def main(argv: list[str] | None = None) -> int:
     max_length: int = args.max_length
     follow_symlinks: bool = args.follow_symlinks
     log_file_arg: Path | None = args.log_file
+    log_format: LogFormat = args.log_format
     verbose: bool = args.verbose
 
     # Validate root path.
-    root = root_arg.resolve()
-    if not root.is_dir():
+    root = Path(os.path.realpath(root_arg))
+    if not os.path.isdir(root):
         print(f"Error: '{root_arg}' is not a directory.", file=sys.stderr)
         return 1
 
@@ -127,9 +141,8 @@ def main(argv: list[str] | None = None) -> int:
         follow_symlinks=follow_symlinks,
     )
 
-    # Display the plan.
-    summary = format_plan_summary(plan, verbose=verbose)
-    print(summary)
+    # Display the plan, streaming it line by line.
+    sys.stdout.writelines(f"{line}\n" for line in iter_plan_summary(plan, verbose=verbose))
 
     if not plan.has_changes:
         print("\nNo renames needed. All filenames are already portable.")
@@ -152,18 +165,17 @@ def main(argv: list[str] | None = None) -> int:
 
     # Execute the plan.
     log_file = log_file_arg if log_file_arg is not None else Path(generate_log_filename())
-    results = execute_plan(plan, log_file=log_file)
+    results = execute_plan(plan, log_file=log_file, log_format=log_format)
 
     # Report results.
-    successes = sum(1 for r in results if r.success)
-    failures = sum(1 for r in results if not r.success)
+    failures = [r for r in results if not r.success]
+    successes = len(results) - len(failures)
 
-    print(f"\nDone: {successes} renamed, {failures} errors.")
-    if failures > 0:
-        for r in results:
-            if not r.success:
-                print(f"  ERROR: {r.action.source} -> {r.error_message}", file=sys.stderr)
+    print(f"\nDone: {successes} renamed, {len(failures)} errors.")
+    for r in failures:
+        print(f"  ERROR: {r.action.source} -> {r.error_message}", file=sys.stderr)
 
-    print(f"Log written to: {log_file}")
+    if results:
+        print(f"Log written to: {log_file}")
 
-    return 1 if failures > 0 else 0
+    return 1 if failures else 0
@@ -2,74 +2,178 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
 import json
 import os
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Literal, cast
 
-from .scanner import EntryKind, RenamePlan, RenameResult
+from .scanner import EntryKind, RenameAction, RenamePlan, RenameResult
 
+# orjson is an optional speedup for writing large logs; fall back to stdlib json.
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:
+    orjson = None
 
-def execute_plan(plan: RenamePlan, *, log_file: Path | None = None) -> list[RenameResult]:
+# Supported rename log layouts (see ``write_rename_log``).
+LogFormat = Literal["json", "ndjson"]
+
+# Short, equal-width labels for display in the plan summary.
+_KIND_LABELS: dict[EntryKind, str] = {
+    EntryKind.DIRECTORY: "[dir] ",
+    EntryKind.SYMLINK: "[link]",
+    EntryKind.FILE: "[file]",
+}
+
+# Upper bound on concurrent rename threads used by ``execute_plan``.
+_MAX_RENAME_WORKERS: int = min(32, (os.cpu_count() or 1) * 4)
+
+# Whether renames can be issued relative to an open directory (not on Windows).
+# os.lstat is os.stat(follow_symlinks=False), so only os.stat is listed there.
+_RENAME_DIR_FD: bool = os.rename in os.supports_dir_fd and os.stat in os.supports_dir_fd
+
+
+def execute_plan(
+    plan: RenamePlan,
+    *,
+    log_file: Path | None = None,
+    log_format: LogFormat = "json",
+    parallel: bool = True,
+) -> list[RenameResult]:
     """Execute all rename actions in *plan*.
 
+    Actions are grouped by parent directory and the groups run deepest
+    first, so each rename happens while every ancestor of its source still
+    has its original name.  Within a directory, files and symlinks are
+    renamed before subdirectories.
+
+    When *parallel* is ``True``, directories at the same depth are processed
+    concurrently on a bounded thread pool (renames in different directories
+    are independent, and the GIL is released during the syscall).  Each
+    directory is still handled by a single thread, and a depth level only
+    starts once the deeper one has finished.  On Windows renames always run
+    serially.
+
+    Where supported, each directory is opened once and its renames are
+    issued relative to that descriptor, so the kernel does not resolve the
+    full parent path again for every entry.
+
     For each action where ``needs_rename`` is ``True``:
-      1. Verify the source still exists.
-      2. Verify the destination does not already exist.
-      3. Perform ``os.rename(source, destination)``.
+      1. Verify the destination does not already exist.
+      2. Perform ``os.rename(source, destination)``; a missing source is
+         reported from the rename itself rather than checked beforehand
+         (or, if the destination exists, checked before reporting that).
 
     Errors are recorded but do not stop execution of remaining actions.
 
     Args:
         plan: The rename plan to execute.
-        log_file: Optional path where the JSON log will be written.
+        log_file: Optional path where the JSON log will be written.  Nothing
+            is written if no rename was attempted.
+        log_format: Log layout, ``"json"`` or ``"ndjson"`` (see ``write_rename_log``).
+        parallel: Whether to rename in different directories concurrently.
 
     Returns:
-        A list of ``RenameResult`` for every action attempted.
+        A list of ``RenameResult`` for every action attempted, in execution order.
     """
     results: list[RenameResult] = []
+    groups = _group_by_parent(plan.actions)
+
+    if parallel and sys.platform != "win32" and len(groups) > 1:
+        with ThreadPoolExecutor(max_workers=_MAX_RENAME_WORKERS) as executor:
+            # Groups are sorted by depth; each level must finish before the next.
+            for _, level in itertools.groupby(groups, key=lambda g: len(g[0].source.parts)):
+                for group_results in executor.map(_execute_group, level):
+                    results.extend(group_results)
+    else:
+        for group in groups:
+            results.extend(_execute_group(group))
 
-    for action in plan.actions:
-        if not action.needs_rename:
-            continue
+    if log_file is not None:
+        write_rename_log(results, plan.root, log_file, log_format=log_format)
 
-        # Pre-flight checks.
-        if not action.source.exists() and not action.source.is_symlink():
-            results.append(
-                RenameResult(
-                    action=action,
-                    success=False,
-                    error_message=f"Source no longer exists: {action.source}",
-                )
-            )
-            continue
+    return results
 
-        if action.destination.exists() or action.destination.is_symlink():
-            results.append(
-                RenameResult(
-                    action=action,
-                    success=False,
-                    error_message=f"Destination already exists: {action.destination}",
-                )
-            )
-            continue
 
+def _group_by_parent(actions: list[RenameAction]) -> list[list[RenameAction]]:
+    """Group the actions that need renaming by parent directory, in execution order.
+
+    Groups are ordered deepest parent first (ties keep plan order); within a
+    group, non-directory entries come before directories.
+    """
+    groups: dict[Path, list[RenameAction]] = {}
+    for action in actions:
+        if action.needs_rename:
+            groups.setdefault(action.source.parent, []).append(action)
+
+    ordered = sorted(groups.items(), key=lambda item: -len(item[0].parts))
+    return [sorted(group, key=lambda a: a.kind == EntryKind.DIRECTORY) for _, group in ordered]
+
+
+def _execute_group(group: list[RenameAction]) -> list[RenameResult]:
+    """Execute the actions of one directory group sequentially."""
+    dir_fd: int | None = None
+    if _RENAME_DIR_FD:
         try:
-            os.rename(action.source, action.destination)
-            results.append(RenameResult(action=action, success=True))
-        except OSError as exc:
-            results.append(
-                RenameResult(
+            dir_fd = os.open(group[0].source.parent, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            pass  # Fall back to full paths, which report the failure per action.
+    try:
+        return [_execute_action(action, dir_fd) for action in group]
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+
+def _execute_action(action: RenameAction, dir_fd: int | None = None) -> RenameResult:
+    """Run the pre-flight check for *action* and perform the rename.
+
+    With *dir_fd* (an open descriptor for the action's parent directory),
+    the bare names are used relative to it instead of the full paths.
+    """
+    if dir_fd is not None:
+        src, dst = action.original_name, action.final_name
+    else:
+        src, dst = os.fspath(action.source), os.fspath(action.destination)
+
+    try:
+        # The rename itself detects a missing source, so only the destination
+        # needs a pre-flight lstat (which also catches dangling symlinks).
+        if _lstat_or_none(dst, dir_fd) is not None:
+            # A vanished source is still reported as such; only this
+            # failure path pays for the extra lstat.
+            if _lstat_or_none(src, dir_fd) is None:
+                return RenameResult(
                     action=action,
                     success=False,
-                    error_message=str(exc),
+                    error_message=f"Source no longer exists: {action.source}",
                 )
+            return RenameResult(
+                action=action,
+                success=False,
+                error_message=f"Destination already exists: {action.destination}",
             )
-
-    if log_file is not None:
-        write_rename_log(results, plan.root, log_file)
-
-    return results
+        os.rename(src, dst, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+    except (FileNotFoundError, NotADirectoryError):
+        return RenameResult(
+            action=action,
+            success=False,
+            error_message=f"Source no longer exists: {action.source}",
+        )
+    except OSError as exc:
+        if dir_fd is not None:
+            # Report the full paths, as a path-based rename would.
+            source, destination = os.fspath(action.source), os.fspath(action.destination)
+            exc = OSError(exc.errno, exc.strerror, source, None, destination)
+        return RenameResult(action=action, success=False, error_message=str(exc))
+    return RenameResult(action=action, success=True)
 
 
 def format_plan_summary(plan: RenamePlan, *, verbose: bool = False) -> str:
@@ -78,53 +182,79 @@ def format_plan_summary(plan: RenamePlan, *, verbose: bool = False) -> str:
     In normal mode, shows a count and the list of renames.
     In verbose mode, also shows per-entry issues and all warnings.
     """
-    lines: list[str] = []
+    return "\n".join(iter_plan_summary(plan, verbose=verbose))
+
 
-    lines.append(f"Scanned {plan.total_entries_scanned} entries under {plan.root}")
+def iter_plan_summary(plan: RenamePlan, *, verbose: bool = False) -> Iterator[str]:
+    """Yield the lines of ``format_plan_summary`` one at a time (without newlines).
+
+    Lets callers stream the summary of a very large plan to a file or
+    terminal without first building it as one string.
+    """
+    yield f"Scanned {plan.total_entries_scanned} entries under {plan.root}"
 
     if plan.skipped_symlinks:
-        lines.append(
-            f"Skipped {len(plan.skipped_symlinks)} symlinks (use --follow-symlinks to process)"
-        )
+        yield f"Skipped {len(plan.skipped_symlinks)} symlinks (use --follow-symlinks to process)"
         if verbose:
             for sym in plan.skipped_symlinks:
-                lines.append(f"  symlink: {sym}")
+                yield f"  symlink: {sym}"
 
     if not plan.has_changes:
-        return "\n".join(lines)
+        return
 
-    lines.append(f"Found {plan.total_renames_needed} entries to rename:")
-    lines.append("")
+    yield f"Found {plan.total_renames_needed} entries to rename:"
+    yield ""
 
     for action in plan.actions:
         if not action.needs_rename:
             continue
-        kind_label = _kind_label(action.kind)
-        lines.append(f"  {kind_label} {action.source.name} -> {action.final_name}")
-        lines.append(f"         in {action.source.parent}")
+        yield f"  {_KIND_LABELS[action.kind]} {action.source.name} -> {action.final_name}"
+        yield f"         in {action.source.parent}"
         if verbose and action.issues:
             for issue in action.issues:
-                lines.append(f"         * {issue}")
+                yield f"         * {issue}"
 
     if plan.warnings:
-        lines.append("")
-        lines.append(f"Warnings ({len(plan.warnings)}):")
+        yield ""
+        yield f"Warnings ({len(plan.warnings)}):"
         for warning in plan.warnings:
-            lines.append(f"  ! {warning}")
-
-    return "\n".join(lines)
+            yield f"  ! {warning}"
 
 
 def write_rename_log(
     results: list[RenameResult],
     root: Path,
     log_file: Path,
+    *,
+    log_format: LogFormat = "json",
 ) -> None:
     """Write a JSON log file recording all attempted renames.
 
-    The log contains a ``renames`` array of successful renames and an
-    ``errors`` array of failures, suitable for auditing or rollback.
+    With ``log_format="json"`` (the default) the log is a single document
+    containing a ``renames`` array of successful renames and an ``errors``
+    array of failures, suitable for auditing or rollback.
+
+    With ``log_format="ndjson"`` the log is newline-delimited JSON: a header
+    record with the timestamp, root and totals, followed by one record per
+    result.  Records are streamed to disk as they are encoded, so memory use
+    stays flat no matter how many renames were attempted.
+
+    Nothing is written (and *log_file* is not created) when *results* is
+    empty.
+
+    Raises:
+        ValueError: If *log_format* is not recognized.
     """
+    if log_format not in ("json", "ndjson"):
+        raise ValueError(f"Unknown log format: {log_format!r}")
+    if not results:
+        return
+
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    if log_format == "ndjson":
+        _write_ndjson_log(results, root, log_file)
+        return
+
     renames: list[dict[str, str]] = []
     errors: list[dict[str, str]] = []
 
@@ -151,20 +281,88 @@ def write_rename_log(
         "errors": errors,
     }
 
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-    log_file.write_text(json.dumps(log_data, indent=2) + "\n", encoding="utf-8")
+    _write_json_document(log_data, log_file)
+
+
+def _write_json_document(data: object, log_file: Path) -> None:
+    """Write *data* to *log_file* as one two-space-indented JSON document.
+
+    The stdlib encoder's chunks are streamed straight to the file, so a large
+    log is never held in memory as a single string.  With ``orjson`` the
+    whole document is built in memory once instead, trading peak memory for
+    a several times faster write; names ``orjson`` cannot encode fall back to
+    the streaming path.
+    """
+    if orjson is not None:
+        try:
+            encoded = cast(bytes, orjson.dumps(data, option=orjson.OPT_INDENT_2))  # pyright: ignore[reportUnknownMemberType, reportUnnecessaryCast]
+        except TypeError:
+            pass  # Lone surrogates (see _dumps_json).
+        else:
+            log_file.write_bytes(encoded + b"\n")
+            return
+    with open(log_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+        for chunk in json.JSONEncoder(indent=2).iterencode(data):
+            f.write(chunk)
+        f.write("\n")
+
+
+def _write_ndjson_log(results: list[RenameResult], root: Path, log_file: Path) -> None:
+    """Stream *results* to *log_file* as one compact JSON record per line."""
+    total_errors = sum(1 for r in results if not r.success)
+    header = {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "root": str(root),
+        "total_renames": len(results) - total_errors,
+        "total_errors": total_errors,
+    }
+    with open(log_file, "wb", buffering=1 << 20) as f:
+        f.write(_dumps_json(header) + b"\n")
+        for result in results:
+            record: dict[str, str]
+            if result.success:
+                record = {
+                    "status": "renamed",
+                    "source": str(result.action.source),
+                    "destination": str(result.action.destination),
+                }
+            else:
+                record = {"status": "error", "source": str(result.action.source)}
+                if result.error_message:
+                    record["error"] = result.error_message
+            f.write(_dumps_json(record) + b"\n")
+
+
+def _dumps_json(data: object) -> bytes:
+    """Serialize *data* to compact UTF-8 JSON, using ``orjson`` when it is installed.
+
+    ``orjson`` writes non-ASCII characters as UTF-8 where the stdlib encoder
+    ``\\u``-escapes them, so the bytes differ but decode to the same data.
+    """
+    if orjson is not None:
+        try:
+            return cast(bytes, orjson.dumps(data))  # pyright: ignore[reportUnknownMemberType, reportUnnecessaryCast]
+        except TypeError:
+            # orjson rejects lone surrogates, which is how POSIX filenames
+            # that are not valid UTF-8 decode (surrogateescape).
+            pass
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
 
 
 def generate_log_filename() -> str:
     """Generate a timestamped log filename like ``rename_log_20260209_153045.json``."""
-    now = datetime.now(UTC)
-    return f"rename_log_{now.strftime('%Y%m%d_%H%M%S')}.json"
+    return _log_filename_for_second(int(time.time()))
+
+
+@functools.lru_cache(maxsize=1)
+def _log_filename_for_second(epoch_second: int) -> str:
+    """Format the UTC log filename for *epoch_second* (repeat calls within a second are free)."""
+    return time.strftime("rename_log_%Y%m%d_%H%M%S.json", time.gmtime(epoch_second))
 
 
-def _kind_label(kind: EntryKind) -> str:
-    """Return a short label for display, e.g. ``[dir]`` or ``[file]``."""
-    if kind == EntryKind.DIRECTORY:
-        return "[dir] "
-    if kind == EntryKind.SYMLINK:
-        return "[link]"
-    return "[file]"
+def _lstat_or_none(path: str, dir_fd: int | None = None) -> os.stat_result | None:
+    """Return ``os.lstat(path, dir_fd=dir_fd)``, or ``None`` if nothing exists at *path*."""
+    try:
+        return os.lstat(path, dir_fd=dir_fd)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
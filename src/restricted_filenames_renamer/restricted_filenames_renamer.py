@@ -14,6 +14,7 @@ from .renamer import (
     execute_plan,
     format_plan_summary,
     generate_log_filename,
+    iter_plan_summary,
     write_rename_log,
 )
 
@@ -26,6 +27,7 @@ from .sanitizer import (
     UNICODE_CHAR_MAP,
     UNICODE_DOT_REPLACEMENT,
     UNICODE_SPACE_REPLACEMENT,
+    UNICODE_TRANSLATE_TABLE,
     WINDOWS_MAX_PATH,
     handle_reserved_names,
     is_name_safe,
@@ -42,6 +44,7 @@ from .scanner import (
     RenamePlan,
     RenameResult,
     build_rename_plan,
+    iter_rename_actions,
     validate_path_under_root,
 )
 
@@ -79,6 +82,7 @@ __all__ = [
     "CONTROL_CHARS",
     "ALL_RESTRICTED_CHARS",
     "UNICODE_CHAR_MAP",
+    "UNICODE_TRANSLATE_TABLE",
     "UNICODE_DOT_REPLACEMENT",
     "UNICODE_SPACE_REPLACEMENT",
     "DEFAULT_MAX_NAME_LENGTH",
@@ -90,11 +94,13 @@ __all__ = [
     "RenameResult",
     # Scanner functions
     "build_rename_plan",
+    "iter_rename_actions",
     "validate_path_under_root",
     # Renamer functions
     "execute_plan",
     "format_plan_summary",
     "generate_log_filename",
+    "iter_plan_summary",
     "write_rename_log",
     # TUI
     "tui_main",
@@ -17,14 +17,18 @@ The sanitization pipeline:
 
 from __future__ import annotations
 
+import functools
 import re
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Final
 
 # ---------------------------------------------------------------------------
 # Unicode replacement mapping (rclone-style)
 # ---------------------------------------------------------------------------
 
 # Windows-forbidden characters → fullwidth Unicode equivalents.
-_FORBIDDEN_CHAR_MAP: dict[str, str] = {
+_FORBIDDEN_CHAR_MAP: Final[dict[str, str]] = {
     "\\": "\uff3c",  # ＼ FULLWIDTH REVERSE SOLIDUS
     "/": "\uff0f",  # ／ FULLWIDTH SOLIDUS
     ":": "\uff1a",  # ： FULLWIDTH COLON
@@ -37,39 +41,56 @@ _FORBIDDEN_CHAR_MAP: dict[str, str] = {
 }
 
 # ASCII control characters 0x00-0x1F → Unicode Control Pictures U+2400-U+241F.
-_CONTROL_CHAR_MAP: dict[str, str] = {chr(c): chr(0x2400 + c) for c in range(0x00, 0x20)}
+_CONTROL_CHAR_MAP: Final[dict[str, str]] = {chr(c): chr(0x2400 + c) for c in range(0x00, 0x20)}
 
 # Combined mapping: every restricted character → its Unicode replacement.
-UNICODE_CHAR_MAP: dict[str, str] = {**_CONTROL_CHAR_MAP, **_FORBIDDEN_CHAR_MAP}
+UNICODE_CHAR_MAP: Final[dict[str, str]] = {**_CONTROL_CHAR_MAP, **_FORBIDDEN_CHAR_MAP}
+# Replacements must be unique, or two restricted characters would become
+# indistinguishable after sanitization.
+assert len(set(UNICODE_CHAR_MAP.values())) == len(UNICODE_CHAR_MAP)
+
+# The same mapping keyed by codepoint, ready to pass to ``str.translate``.  The
+# public table is a read-only view, so callers cannot change how names are
+# sanitized by mutating it.
+_UNICODE_TRANSLATE_TABLE: Final[dict[int, str]] = str.maketrans(UNICODE_CHAR_MAP)
+UNICODE_TRANSLATE_TABLE: Final[Mapping[int, str]] = MappingProxyType(_UNICODE_TRANSLATE_TABLE)
 
 # Trailing-character replacements.
-UNICODE_DOT_REPLACEMENT: str = "\uff0e"  # ．FULLWIDTH FULL STOP
-UNICODE_SPACE_REPLACEMENT: str = "\u2420"  # ␠ SYMBOL FOR SPACE
+UNICODE_DOT_REPLACEMENT: Final[str] = "\uff0e"  # ．FULLWIDTH FULL STOP
+UNICODE_SPACE_REPLACEMENT: Final[str] = "\u2420"  # ␠ SYMBOL FOR SPACE
 
 # ---------------------------------------------------------------------------
 # Character sets (for validation and quick checks)
 # ---------------------------------------------------------------------------
 
-FORBIDDEN_CHARS: frozenset[str] = frozenset(_FORBIDDEN_CHAR_MAP)
-CONTROL_CHARS: frozenset[str] = frozenset(_CONTROL_CHAR_MAP)
-ALL_RESTRICTED_CHARS: frozenset[str] = FORBIDDEN_CHARS | CONTROL_CHARS
-
-# Pre-compiled regex matching any single restricted character.
-_RESTRICTED_CHAR_RE: re.Pattern[str] = re.compile(
-    "[" + re.escape("".join(sorted(ALL_RESTRICTED_CHARS))) + "]"
+FORBIDDEN_CHARS: Final[frozenset[str]] = frozenset(_FORBIDDEN_CHAR_MAP)
+CONTROL_CHARS: Final[frozenset[str]] = frozenset(_CONTROL_CHAR_MAP)
+ALL_RESTRICTED_CHARS: Final[frozenset[str]] = FORBIDDEN_CHARS | CONTROL_CHARS
+
+# Pre-compiled regex matching any single restricted character.  Written as a
+# literal class with a contiguous control-character range (rather than 41
+# escaped codepoints) so it compiles to a compact charset test.
+_RESTRICTED_CHAR_RE: Final[re.Pattern[str]] = re.compile(r'[\x00-\x1f\\/:*?"<>|]')
+# All restricted characters are ASCII, so checking 0x00-0x7F proves the
+# pattern matches exactly ALL_RESTRICTED_CHARS.
+assert {chr(c) for c in range(0x80) if _RESTRICTED_CHAR_RE.match(chr(c))} == ALL_RESTRICTED_CHARS
+
+# Windows reserved device names (matched case-insensitively against the stem).
+_RESERVED_NAMES: Final[frozenset[str]] = frozenset(
+    ["CON", "PRN", "AUX", "NUL"] + [f"COM{i}" for i in range(10)] + [f"LPT{i}" for i in range(10)]
 )
+_RESERVED_NAME_MAX_LEN: Final[int] = max(len(n) for n in _RESERVED_NAMES)
 
-# Windows reserved device names (case-insensitive, exact stem match).
-_RESERVED_NAMES_RE: re.Pattern[str] = re.compile(
-    r"^(CON|PRN|AUX|NUL|COM\d|LPT\d)$",
-    re.IGNORECASE,
+# Translation table for the trailing dots/spaces replaced in Unicode mode.
+_TRAILING_TRANSLATE_TABLE: Final[dict[int, str]] = str.maketrans(
+    {".": UNICODE_DOT_REPLACEMENT, " ": UNICODE_SPACE_REPLACEMENT}
 )
 
-# Trailing dots and/or spaces.
-_TRAILING_DOTS_SPACES_RE: re.Pattern[str] = re.compile(r"[. ]+$")
+# Shared "no issues" result, so clean names don't each allocate an empty container.
+_EMPTY_ISSUES: Final[tuple[str, ...]] = ()
 
-DEFAULT_MAX_NAME_LENGTH: int = 255
-WINDOWS_MAX_PATH: int = 260
+DEFAULT_MAX_NAME_LENGTH: Final[int] = 255
+WINDOWS_MAX_PATH: Final[int] = 260
 
 
 def replace_forbidden_chars(name: str, replace_char: str | None = None) -> tuple[str, list[str]]:
@@ -84,21 +105,24 @@ def replace_forbidden_chars(name: str, replace_char: str | None = None) -> tuple
     issues: list[str] = []
 
     if replace_char is not None:
-        result = _RESTRICTED_CHAR_RE.sub(replace_char, name)
+        result = name.translate(_replace_char_table(replace_char))
     else:
         result = _replace_chars_unicode(name)
 
     if result != name:
-        found_control = any(c in CONTROL_CHARS for c in name if c not in FORBIDDEN_CHARS)
-        found_forbidden = any(c in FORBIDDEN_CHARS for c in name)
+        # Classify the replaced characters in a single pass over the name.
+        forbidden_found: set[str] = set()
+        control_found: set[str] = set()
+        for c in name:
+            if c in FORBIDDEN_CHARS:
+                forbidden_found.add(c)
+            elif c in CONTROL_CHARS:
+                control_found.add(c)
         parts: list[str] = []
-        if found_forbidden:
-            chars = sorted({c for c in name if c in FORBIDDEN_CHARS})
-            parts.append(f"forbidden characters {chars!r}")
-        if found_control:
-            codes = sorted(
-                f"0x{ord(c):02X}" for c in name if c in CONTROL_CHARS and c not in FORBIDDEN_CHARS
-            )
+        if forbidden_found:
+            parts.append(f"forbidden characters {sorted(forbidden_found)!r}")
+        if control_found:
+            codes = [f"0x{ord(c):02X}" for c in sorted(control_found)]
             parts.append(f"control characters {codes}")
         issues.append(f"Replaced {', '.join(parts)}")
     return result, issues
@@ -115,13 +139,12 @@ def strip_trailing_dots_spaces(name: str, replace_char: str | None = None) -> tu
 
     Returns ``(sanitized_name, issues)``.
     """
-    issues: list[str] = []
-    match = _TRAILING_DOTS_SPACES_RE.search(name)
-    if not match:
-        return name, issues
+    if not name.endswith((".", " ")):
+        return name, []
 
-    trailing = match.group()
-    prefix = name[: match.start()]
+    issues: list[str] = []
+    prefix = name.rstrip(". ")
+    trailing = name[len(prefix) :]
 
     if replace_char is not None:
         # Simple mode: strip trailing chars.
@@ -132,10 +155,7 @@ def strip_trailing_dots_spaces(name: str, replace_char: str | None = None) -> tu
             issues.append("Name was empty after stripping; replaced with fallback character")
     else:
         # Unicode mode: replace each trailing char with its Unicode equivalent.
-        replaced_trailing = trailing.replace(".", UNICODE_DOT_REPLACEMENT).replace(
-            " ", UNICODE_SPACE_REPLACEMENT
-        )
-        result = prefix + replaced_trailing
+        result = prefix + trailing.translate(_TRAILING_TRANSLATE_TABLE)
         issues.append(f"Replaced trailing characters: {trailing!r}")
 
     return result, issues
@@ -150,10 +170,10 @@ def handle_reserved_names(name: str, prefix_char: str = "_") -> tuple[str, list[
     Returns ``(sanitized_name, issues)``.
     """
     issues: list[str] = []
-    dot_idx = name.find(".")
-    stem = name[:dot_idx] if dot_idx != -1 else name
+    stem = name.partition(".")[0]
 
-    if _RESERVED_NAMES_RE.match(stem):
+    # The length check lets almost every name skip the ``upper()`` allocation.
+    if len(stem) <= _RESERVED_NAME_MAX_LEN and stem.upper() in _RESERVED_NAMES:
         result = prefix_char + name
         issues.append(f"Reserved Windows device name: {stem!r}")
         return result, issues
@@ -161,12 +181,22 @@ def handle_reserved_names(name: str, prefix_char: str = "_") -> tuple[str, list[
     return name, issues
 
 
-def truncate_name(name: str, max_length: int = DEFAULT_MAX_NAME_LENGTH) -> tuple[str, list[str]]:
+def truncate_name(
+    name: str,
+    max_length: int = DEFAULT_MAX_NAME_LENGTH,
+    *,
+    count_bytes: bool = False,
+) -> tuple[str, list[str]]:
     """Truncate *name* to *max_length* characters, preserving the file extension.
 
     If the extension alone exceeds *max_length*, the extension is truncated too.
+    With *count_bytes*, *max_length* is measured in UTF-8 bytes instead (as
+    ext4 and APFS enforce), and the cut never splits a multi-byte character.
     Returns ``(truncated_name, issues)``.
     """
+    if count_bytes:
+        return _truncate_name_bytes(name, max_length)
+
     if len(name) <= max_length:
         return name, []
 
@@ -186,11 +216,44 @@ def truncate_name(name: str, max_length: int = DEFAULT_MAX_NAME_LENGTH) -> tuple
     return stem[:max_stem] + ext, issues
 
 
+def _truncate_name_bytes(name: str, max_bytes: int) -> tuple[str, list[str]]:
+    """Byte-measured variant of ``truncate_name`` (see its *count_bytes* flag)."""
+    encoded = name.encode("utf-8", "surrogateescape")
+    if len(encoded) <= max_bytes:
+        return name, []
+
+    issues = [f"Name length {len(encoded)} bytes exceeds limit {max_bytes}; truncated"]
+
+    dot_idx = name.rfind(".")
+    if dot_idx <= 0:
+        return utf8_prefix(encoded, max_bytes), issues
+
+    ext = name[dot_idx:]
+    ext_len = len(ext.encode("utf-8", "surrogateescape"))
+    if ext_len >= max_bytes:
+        return utf8_prefix(encoded, max_bytes), issues
+
+    stem = name[:dot_idx].encode("utf-8", "surrogateescape")
+    return utf8_prefix(stem, max_bytes - ext_len) + ext, issues
+
+
+def utf8_prefix(encoded: bytes, limit: int) -> str:
+    """Decode the longest prefix of *encoded* that fits in *limit* bytes and ends on a character boundary.
+
+    Shared with the scanner's suffixed-name fitting.  Not re-exported by the package.
+    """
+    # Back off while the first excluded byte is a continuation byte.
+    while 0 < limit < len(encoded) and encoded[limit] & 0xC0 == 0x80:
+        limit -= 1
+    return encoded[:limit].decode("utf-8", "surrogateescape")
+
+
 def sanitize_name(
     name: str,
     *,
     replace_char: str | None = None,
     max_length: int = DEFAULT_MAX_NAME_LENGTH,
+    count_bytes: bool = False,
 ) -> tuple[str, list[str]]:
     """Run the full sanitization pipeline on a single filename or directory name.
 
@@ -203,33 +266,104 @@ def sanitize_name(
       1. Replace forbidden / control characters
       2. Replace trailing dots and spaces
       3. Handle Windows reserved names (always prefixed with ``_``)
-      4. Truncate if exceeding *max_length*
+      4. Truncate if exceeding *max_length* (in UTF-8 bytes with *count_bytes*,
+         see ``truncate_name``)
 
     Returns ``(sanitized_name, all_issues)``.
+
+    Results are memoized (see ``sanitize_name.cache_clear``), so repeated
+    basenames across a large tree only run the pipeline once.
     """
-    all_issues: list[str] = []
+    sanitized, issues = sanitize_name_cached(name, replace_char, max_length, count_bytes)
+    return sanitized, list(issues)
+
 
-    name, issues = replace_forbidden_chars(name, replace_char)
-    all_issues.extend(issues)
+@functools.lru_cache(maxsize=65536)
+def sanitize_name_cached(
+    name: str,
+    replace_char: str | None,
+    max_length: int,
+    count_bytes: bool = False,
+) -> tuple[str, tuple[str, ...]]:
+    """Memoized body of ``sanitize_name``; issues are a tuple so cached results stay immutable.
 
-    name, issues = strip_trailing_dots_spaces(name, replace_char)
-    all_issues.extend(issues)
+    Used directly by the scanner, which only reads the issues and so skips
+    ``sanitize_name``'s per-call list copy.  Not re-exported by the package.
 
-    name, issues = handle_reserved_names(name)
-    all_issues.extend(issues)
+    Each stage is only invoked when a cheap check shows it would change the
+    name, so clean names pass through without any per-stage allocations.
+    """
+    issues: list[str] | None = None  # Allocated on the first issue only.
+
+    if _RESTRICTED_CHAR_RE.search(name) is not None:
+        name, issues = replace_forbidden_chars(name, replace_char)
+
+    if name.endswith((".", " ")):
+        name, stage_issues = strip_trailing_dots_spaces(name, replace_char)
+        issues = stage_issues if issues is None else issues + stage_issues
+
+    dot_idx = name.find(".")
+    stem_len = len(name) if dot_idx == -1 else dot_idx
+    if stem_len <= _RESERVED_NAME_MAX_LEN:
+        name, stage_issues = handle_reserved_names(name)
+        if stage_issues:
+            issues = stage_issues if issues is None else issues + stage_issues
 
-    name, issues = truncate_name(name, max_length)
-    all_issues.extend(issues)
+    if _is_too_long(name, max_length, count_bytes):
+        name, stage_issues = truncate_name(name, max_length, count_bytes=count_bytes)
+        issues = stage_issues if issues is None else issues + stage_issues
 
-    return name, all_issues
+    return name, _EMPTY_ISSUES if issues is None else tuple(issues)
 
 
-def is_name_safe(name: str, *, max_length: int = DEFAULT_MAX_NAME_LENGTH) -> bool:
-    """Return ``True`` if *name* requires no sanitization."""
-    sanitized, _ = sanitize_name(name, max_length=max_length)
-    return sanitized == name
+sanitize_name.cache_clear = sanitize_name_cached.cache_clear  # pyright: ignore[reportFunctionMemberAccess]
+
+
+def is_name_safe(
+    name: str,
+    *,
+    max_length: int = DEFAULT_MAX_NAME_LENGTH,
+    count_bytes: bool = False,
+) -> bool:
+    """Return ``True`` if *name* requires no sanitization.
+
+    Equivalent to ``sanitize_name(name, max_length=max_length,
+    count_bytes=count_bytes)[0] == name``, but checks each pipeline condition
+    directly so that safe names (the common case) are accepted without
+    building any intermediate strings.
+    """
+    if _is_too_long(name, max_length, count_bytes):
+        return False
+    if _RESTRICTED_CHAR_RE.search(name) is not None:
+        return False
+    if name.endswith((".", " ")):
+        return False
+    stem = name.partition(".")[0]
+    return len(stem) > _RESERVED_NAME_MAX_LEN or stem.upper() not in _RESERVED_NAMES
+
+
+def _is_too_long(name: str, max_length: int, count_bytes: bool) -> bool:
+    """Return ``True`` if *name* exceeds *max_length* characters (or UTF-8 bytes)."""
+    if len(name) > max_length:
+        return True
+    # An ASCII name is as long in bytes as in characters, so only others are encoded.
+    return (
+        count_bytes
+        and not name.isascii()
+        and len(name.encode("utf-8", "surrogateescape")) > max_length
+    )
 
 
 def _replace_chars_unicode(name: str) -> str:
     """Replace each restricted character with its Unicode equivalent."""
-    return "".join(UNICODE_CHAR_MAP.get(c, c) for c in name)
+    return name.translate(_UNICODE_TRANSLATE_TABLE)
+
+
+@functools.lru_cache(maxsize=8)
+def _replace_char_table(replace_char: str) -> dict[int, str]:
+    """Return the translation table mapping every restricted character to *replace_char*.
+
+    Cached (bounded, since the TUI lets users try arbitrary characters) so the
+    table is built once per override character.
+    """
+    return {ord(c): replace_char for c in ALL_RESTRICTED_CHARS}
@@ -9,13 +9,18 @@ from __future__ import annotations
 
 import enum
 import os
+import sys
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from .sanitizer import (
     DEFAULT_MAX_NAME_LENGTH,
     WINDOWS_MAX_PATH,
-    sanitize_name,
+    is_name_safe,
+    sanitize_name_cached,
+    utf8_prefix,
 )
 
 
@@ -27,7 +32,7 @@ class EntryKind(enum.Enum):
     SYMLINK = "symlink"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RenameAction:
     """A single planned rename operation."""
 
@@ -40,7 +45,7 @@ class RenameAction:
     needs_rename: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class RenamePlan:
     """Complete rename plan for a directory tree."""
 
@@ -57,7 +62,7 @@ class RenamePlan:
         return self.total_renames_needed > 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RenameResult:
     """Result of executing a single rename action."""
 
@@ -66,14 +71,18 @@ class RenameResult:
     error_message: str | None = None
 
 
-def validate_path_under_root(path: Path, root: Path) -> None:
-    """Raise ``ValueError`` if *path* is not under *root* after resolution."""
-    resolved = path.resolve()
-    root_resolved = root.resolve()
+def validate_path_under_root(path: str | os.PathLike[str], root: str | os.PathLike[str]) -> None:
+    """Raise ``ValueError`` if *path* is not under *root* after resolution.
+
+    Both arguments may be ``str`` or ``Path``, so callers working with raw
+    ``os.scandir`` paths need not wrap them first.
+    """
+    resolved = os.path.realpath(path)
+    root_resolved = os.path.realpath(root)
     # Use os.path.commonpath to avoid string-prefix false positives
     # (e.g. /root-other being mistaken as under /root).
     try:
-        common = Path(os.path.commonpath([resolved, root_resolved]))
+        common = os.path.commonpath([resolved, root_resolved])
     except ValueError:
         # Different drives on Windows.
         raise ValueError(f"Path {path} is not under root {root}") from None
@@ -81,10 +90,80 @@ def validate_path_under_root(path: Path, root: Path) -> None:
         raise ValueError(f"Path {path} is not under root {root}")
 
 
+def _is_path_under(path: str, root: str) -> bool:
+    """Return ``True`` if the normalized absolute *path* is *root* or below it."""
+    # Compare against root plus a trailing separator (so /root-other is not
+    # under /root), which also handles a root of "/".
+    return path == root or path.startswith(os.path.join(root, ""))
+
+
+def _is_plain_name(name: str) -> bool:
+    """Return ``True`` if *name* is a single path component (no separators, not ``.``/``..``)."""
+    if name in ("", ".", ".."):
+        return False
+    if os.sep in name:
+        return False
+    return os.altsep is None or os.altsep not in name
+
+
+def _walk_bottom_up(
+    root: str,
+    follow_symlinks: bool,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> Iterator[tuple[str, list[os.DirEntry[str]]]]:
+    """Yield ``(dirpath, entries)`` for every directory under *root*, deepest first.
+
+    A post-order equivalent of ``os.walk(root, topdown=False)`` that hands
+    out the ``os.DirEntry`` objects from ``os.scandir`` instead of bare
+    names, so callers can classify entries without re-stat'ing them.
+    Like ``os.walk``, directories that cannot be listed are skipped silently,
+    and symlinked directories are only descended into if *follow_symlinks*.
+    If *is_cancelled* is given, it is polled before each directory and the
+    walk stops as soon as it returns ``True``.
+    """
+    # Stack items are (dirpath, entries); entries is None until listed.
+    stack: list[tuple[str, list[os.DirEntry[str]] | None]] = [(root, None)]
+    while stack:
+        if is_cancelled is not None and is_cancelled():
+            return
+        dirpath, entries = stack.pop()
+        if entries is not None:
+            yield dirpath, entries
+            continue
+
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        stack.append((dirpath, entries))
+        # Push in reverse so subdirectories are visited in listing order.
+        for entry in reversed(entries):
+            if _should_descend(entry, follow_symlinks):
+                stack.append((entry.path, None))
+
+
+def _should_descend(entry: os.DirEntry[str], follow_symlinks: bool) -> bool:
+    """Return ``True`` if the walk should list *entry* as a subdirectory."""
+    return _is_dir(entry, follow_symlinks=True) and (follow_symlinks or not entry.is_symlink())
+
+
+def _is_dir(entry: os.DirEntry[str], *, follow_symlinks: bool) -> bool:
+    """Return ``entry.is_dir()``, treating errors as "not a directory" like ``os.walk``."""
+    try:
+        return entry.is_dir(follow_symlinks=follow_symlinks)
+    except OSError:
+        return False
+
+
 def _resolve_collisions(
     planned_renames: dict[str, str],
     untouched_names: set[str],
     max_length: int = DEFAULT_MAX_NAME_LENGTH,
+    *,
+    case_insensitive: bool = False,
+    count_bytes: bool = False,
 ) -> dict[str, str]:
     """Resolve name collisions within a single directory.
 
@@ -94,40 +173,78 @@ def _resolve_collisions(
         untouched_names: Names of entries in the same directory that do NOT
             need renaming (these occupy name slots).
         max_length: Maximum allowed name length.
+        case_insensitive: Also treat names that differ only in case as colliding.
+        count_bytes: Measure *max_length* in UTF-8 bytes rather than characters.
 
     Returns:
-        Mapping of ``original_name -> final_collision_free_name``.
+        Mapping of ``original_name -> final_collision_free_name``, in sorted
+        order of the original names.
     """
     # Names already taken (by entries that aren't being renamed).
     taken: set[str] = set(untouched_names)
+    # Casefolded copy of *taken*, only maintained when case matters.
+    taken_ci: set[str] | None = (
+        {n.casefold() for n in untouched_names} if case_insensitive else None
+    )
     result: dict[str, str] = {}
+    # desired_name -> first suffix counter not yet known to be taken.
+    next_counter: dict[str, int] = {}
 
-    # Process in sorted order for deterministic results.
+    # Process in sorted order for deterministic results.  Callers rely on the
+    # returned dict keeping this order, so it is the only sort per directory.
     for original, desired in sorted(planned_renames.items()):
-        final = _find_available_name(desired, taken, max_length)
+        final = _find_available_name(
+            desired, taken, max_length, next_counter, taken_ci, count_bytes=count_bytes
+        )
         taken.add(final)
+        if taken_ci is not None:
+            taken_ci.add(final.casefold())
         result[original] = final
 
     return result
 
 
-def _find_available_name(desired: str, taken: set[str], max_length: int) -> str:
+def _split_ext(name: str) -> tuple[str, str]:
+    """Split *name* into ``(stem, ext)`` at the last dot; a leading dot is not an extension.
+
+    The extension is interned: a directory typically repeats a handful of
+    extensions, so colliding names share one string per extension.
+    """
+    dot_idx = name.rfind(".")
+    if dot_idx <= 0:
+        return name, ""
+    return name[:dot_idx], sys.intern(name[dot_idx:])
+
+
+def _find_available_name(
+    desired: str,
+    taken: set[str],
+    max_length: int,
+    next_counter: dict[str, int] | None = None,
+    taken_ci: set[str] | None = None,
+    *,
+    count_bytes: bool = False,
+) -> str:
     """Find a name that doesn't collide, appending ``_1``, ``_2``, etc. if needed.
 
     The suffix is inserted before the file extension: ``file_1.txt``.
+
+    If *next_counter* is given, it remembers per *desired* name where the
+    previous search stopped.  Since *taken* only grows, every lower counter is
+    still taken, so many entries sharing one desired name are resolved in
+    linear rather than quadratic time with identical results.
+
+    If *taken_ci* (the casefolded names of *taken*) is given, a candidate
+    must also not match any taken name case-insensitively.
+
+    With *count_bytes*, a candidate over *max_length* UTF-8 bytes has its
+    stem shortened (at a character boundary) to make room for the suffix.
     """
-    if desired not in taken:
+    if desired not in taken and (taken_ci is None or desired.casefold() not in taken_ci):
         return desired
 
-    dot_idx = desired.rfind(".")
-    if dot_idx <= 0:
-        stem = desired
-        ext = ""
-    else:
-        stem = desired[:dot_idx]
-        ext = desired[dot_idx:]
-
-    counter = 1
+    stem, ext = _split_ext(desired)
+    counter = 1 if next_counter is None else next_counter.get(desired, 1)
     while True:
         suffix = f"_{counter}"
         candidate_stem = stem + suffix
@@ -140,103 +257,144 @@ def _find_available_name(desired: str, taken: set[str], max_length: int) -> str:
             candidate = stem[:max_stem_len] + suffix + ext
         else:
             candidate = candidate_stem + ext
+        if count_bytes and not candidate.isascii():
+            candidate = _fit_suffixed_name_bytes(candidate, stem, suffix + ext, max_length)
 
-        if candidate not in taken:
+        if candidate not in taken and (taken_ci is None or candidate.casefold() not in taken_ci):
+            if next_counter is not None:
+                next_counter[desired] = counter + 1
             return candidate
         counter += 1
 
 
-def build_rename_plan(
-    root: Path,
-    *,
-    replace_char: str | None = None,
-    max_length: int = DEFAULT_MAX_NAME_LENGTH,
-    follow_symlinks: bool = False,
-) -> RenamePlan:
-    """Walk the filesystem under *root* and build a complete rename plan.
+def _fit_suffixed_name_bytes(candidate: str, stem: str, tail: str, max_bytes: int) -> str:
+    """Return *candidate*, or *stem* shortened so ``stem + tail`` fits in *max_bytes* UTF-8 bytes."""
+    if len(candidate.encode("utf-8", "surrogateescape")) <= max_bytes:
+        return candidate
+    budget = max_bytes - len(tail.encode("utf-8", "surrogateescape"))
+    if budget < 1:
+        return candidate  # As in character mode, nothing sensible fits.
+    return utf8_prefix(stem.encode("utf-8", "surrogateescape"), budget) + tail
 
-    The plan is ordered for safe execution: entries within each directory are
-    renamed before the directory itself, processing from the deepest level up.
-
-    Args:
-        root: Root directory to scan (must exist and be a directory).
-        replace_char: Character to replace forbidden characters with.
-        max_length: Maximum allowed filename length.
-        follow_symlinks: Whether to follow symbolic links.
-
-    Returns:
-        A ``RenamePlan`` with ordered actions.
 
-    Raises:
-        ValueError: If *root* is not a directory.
+@dataclass(frozen=True)
+class _PlanSettings:
+    """Options shared by every directory of one ``build_rename_plan`` call."""
+
+    replace_char: str | None
+    max_length: int
+    follow_symlinks: bool
+    case_insensitive: bool
+    count_bytes: bool
+
+
+def _plan_subtree(
+    plan: RenamePlan,
+    top: str,
+    settings: _PlanSettings,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> Iterator[RenameAction]:
+    """Yield the actions for every directory under *top* (inclusive), deepest first."""
+    # _walk_bottom_up yields deepest directories first, together with the
+    # os.DirEntry objects for all entries (files + subdirs) in that directory.
+    for dirpath_str, dir_entries in _walk_bottom_up(top, settings.follow_symlinks, is_cancelled):
+        yield from _plan_directory(plan, dirpath_str, dir_entries, settings)
+
+
+def _plan_directory(
+    plan: RenamePlan,
+    dirpath_str: str,
+    dir_entries: list[os.DirEntry[str]],
+    settings: _PlanSettings,
+) -> Iterator[RenameAction]:
+    """Yield the rename actions for a single directory.
+
+    Warnings, skipped symlinks and counters are recorded on *plan*; the
+    actions are left to the caller.
     """
-    root = root.resolve()
-    if not root.is_dir():
-        raise ValueError(f"Root path is not a directory: {root}")
+    root = plan.root
+    replace_char = settings.replace_char
+    max_length = settings.max_length
+    count_bytes = settings.count_bytes
+    follow_symlinks = settings.follow_symlinks
+
+    # Paths are measured as strings; Path objects are only built for the
+    # RenameActions handed back to callers.  The trailing separator makes
+    # this work for a root of "/" too.
+    dirpath_prefix = os.path.join(dirpath_str, "")
+
+    # Classify entries. DirEntry caches the file type reported by the
+    # directory listing, so this needs no extra stat calls per entry.
+    entries: list[tuple[str, EntryKind]] = []
+    # Bound to locals to avoid attribute lookups in the per-entry hot loop.
+    add_entry = entries.append
+    symlink_kind, directory_kind, file_kind = (
+        EntryKind.SYMLINK,
+        EntryKind.DIRECTORY,
+        EntryKind.FILE,
+    )
+
+    for entry in dir_entries:
+        if entry.is_symlink():
+            if not follow_symlinks:
+                plan.skipped_symlinks.append(Path(entry.path))
+                plan.total_entries_scanned += 1
+                continue
+            add_entry((entry.name, symlink_kind))
+        elif _is_dir(entry, follow_symlinks=False):
+            add_entry((entry.name, directory_kind))
+        else:
+            add_entry((entry.name, file_kind))
+
+    plan.total_entries_scanned += len(entries)
+
+    # Sanitize each entry and separate into needs-rename vs. clean.
+    planned_renames: dict[str, str] = {}  # original_name -> desired_name
+    entry_info: dict[
+        str, tuple[EntryKind, tuple[str, ...]]
+    ] = {}  # original_name -> (kind, issues), for planned renames only
+    # Only a name longer than the rest of the MAX_PATH budget can exceed it.
+    name_budget = WINDOWS_MAX_PATH - len(dirpath_prefix)
+
+    for name, kind in entries:
+        # Most names are already clean; accept them without running the pipeline.
+        if not is_name_safe(name, max_length=max_length, count_bytes=count_bytes):
+            # Use the memoized pipeline directly: its issues are already an
+            # immutable tuple (shared when empty), so no per-entry copies.
+            sanitized, issues = sanitize_name_cached(name, replace_char, max_length, count_bytes)
+            if sanitized != name:
+                planned_renames[name] = sanitized
+                entry_info[name] = (kind, issues)
+                continue
+        # The entry keeps its name; warn about a long path (even if not renamed).
+        if len(name) > name_budget:
+            plan.warnings.append(
+                f"Path length {len(dirpath_prefix) + len(name)} exceeds Windows MAX_PATH "
+                f"({WINDOWS_MAX_PATH}): {dirpath_prefix}{name}"
+            )
 
-    plan = RenamePlan(root=root)
+    # Resolve collisions and emit RenameActions; a clean directory skips both.
+    if planned_renames:
+        # Entries keeping their names occupy those slots.
+        untouched_names = {name for name, _ in entries if name not in planned_renames}
+        final_names = _resolve_collisions(
+            planned_renames,
+            untouched_names,
+            max_length,
+            case_insensitive=settings.case_insensitive,
+            count_bytes=count_bytes,
+        )
+        # Destinations are plain names that don't exist yet, so each is under
+        # the root exactly when its directory is.  Without symlinks every walked
+        # directory is a real path below the resolved root and a string check
+        # suffices; followed links may lead anywhere, so resolve the directory
+        # (once here rather than per action).
+        real_dirpath = os.path.realpath(dirpath_str) if follow_symlinks else dirpath_str
+        dir_under_root = _is_path_under(real_dirpath, os.fspath(root))
 
-    # os.walk with topdown=False yields deepest directories first.
-    # Within each yielded (dirpath, dirnames, filenames), we process
-    # all entries (files + subdirs) in that directory.
-    for dirpath_str, dirnames, filenames in os.walk(
-        root, topdown=False, followlinks=follow_symlinks
-    ):
         dirpath = Path(dirpath_str)
 
-        # Collect all entries in this directory: files + subdirectories.
-        entries: list[tuple[str, EntryKind]] = []
-
-        for fname in filenames:
-            fpath = dirpath / fname
-            if fpath.is_symlink():
-                if not follow_symlinks:
-                    plan.skipped_symlinks.append(fpath)
-                    plan.total_entries_scanned += 1
-                    continue
-                entries.append((fname, EntryKind.SYMLINK))
-            else:
-                entries.append((fname, EntryKind.FILE))
-
-        for dname in dirnames:
-            dpath = dirpath / dname
-            if dpath.is_symlink():
-                if not follow_symlinks:
-                    plan.skipped_symlinks.append(dpath)
-                    plan.total_entries_scanned += 1
-                    continue
-                entries.append((dname, EntryKind.SYMLINK))
-            else:
-                entries.append((dname, EntryKind.DIRECTORY))
-
-        plan.total_entries_scanned += len(entries)
-
-        # Sanitize each entry and separate into needs-rename vs. clean.
-        planned_renames: dict[str, str] = {}  # original_name -> desired_name
-        entry_info: dict[
-            str, tuple[EntryKind, tuple[str, ...]]
-        ] = {}  # original_name -> (kind, issues)
-        untouched_names: set[str] = set()
-
-        for name, kind in entries:
-            sanitized, issues = sanitize_name(
-                name, replace_char=replace_char, max_length=max_length
-            )
-            if sanitized != name:
-                planned_renames[name] = sanitized
-                entry_info[name] = (kind, tuple(issues))
-            else:
-                untouched_names.add(name)
-                entry_info[name] = (kind, tuple(issues))
-
-        # Resolve collisions.
-        if planned_renames:
-            final_names = _resolve_collisions(planned_renames, untouched_names, max_length)
-        else:
-            final_names = {}
-
-        # Emit RenameActions.
-        for original_name, final_name in sorted(final_names.items()):
+        for original_name, final_name in final_names.items():  # Already sorted.
             source = dirpath / original_name
             destination = dirpath / final_name
             kind, issues = entry_info[original_name]
@@ -248,7 +406,16 @@ def build_rename_plan(
                     f"Name collision resolved: appended suffix to get {final_name!r}",
                 )
 
-            validate_path_under_root(destination, root)
+            # A degenerate result (e.g. "..." with replace char "." becomes ".")
+            # is not a name that can be renamed to; report it and move on.
+            if not _is_plain_name(final_name):
+                plan.warnings.append(
+                    f"Cannot rename {dirpath_prefix}{original_name}: "
+                    f"sanitized name {final_name!r} is not a valid name"
+                )
+                continue
+            if not dir_under_root:
+                raise ValueError(f"Path {destination} is not under root {root}")
 
             action = RenameAction(
                 source=source,
@@ -259,25 +426,168 @@ def build_rename_plan(
                 issues=issues,
                 needs_rename=True,
             )
-            plan.actions.append(action)
             plan.total_renames_needed += 1
 
             # Check Windows MAX_PATH.
-            dest_len = len(str(destination))
+            dest_len = len(dirpath_prefix) + len(final_name)
             if dest_len > WINDOWS_MAX_PATH:
                 plan.warnings.append(
                     f"Path length {dest_len} exceeds Windows MAX_PATH ({WINDOWS_MAX_PATH}): "
-                    f"{destination}"
+                    f"{dirpath_prefix}{final_name}"
                 )
 
-        # Also warn about existing entries with long paths (even if not renamed).
-        for name in untouched_names:
-            full_path = dirpath / name
-            path_len = len(str(full_path))
-            if path_len > WINDOWS_MAX_PATH:
-                plan.warnings.append(
-                    f"Path length {path_len} exceeds Windows MAX_PATH ({WINDOWS_MAX_PATH}): "
-                    f"{full_path}"
-                )
+            yield action
+
+
+def _resolve_root(root: Path) -> Path:
+    """Return *root* resolved, raising ``ValueError`` if it is not a directory."""
+    root = root.resolve()
+    if not root.is_dir():
+        raise ValueError(f"Root path is not a directory: {root}")
+    return root
 
+
+def build_rename_plan(
+    root: Path,
+    *,
+    replace_char: str | None = None,
+    max_length: int = DEFAULT_MAX_NAME_LENGTH,
+    follow_symlinks: bool = False,
+    case_insensitive: bool = sys.platform in ("win32", "darwin"),
+    count_bytes: bool = sys.platform != "win32",
+    workers: int = 1,
+) -> RenamePlan:
+    """Walk the filesystem under *root* and build a complete rename plan.
+
+    The plan is ordered for safe execution: entries within each directory are
+    renamed before the directory itself, processing from the deepest level up.
+
+    Args:
+        root: Root directory to scan (must exist and be a directory).
+        replace_char: Character to replace forbidden characters with.
+        max_length: Maximum allowed filename length.
+        follow_symlinks: Whether to follow symbolic links.
+        case_insensitive: Whether names differing only in case collide, as on
+            Windows and default macOS volumes.  Defaults to ``True`` on those
+            platforms.
+        count_bytes: Measure *max_length* in UTF-8 bytes rather than
+            characters.  POSIX filesystems limit names in bytes, and each
+            Unicode replacement character takes three, so this defaults to
+            ``True`` everywhere but Windows (whose limit is in characters).
+        workers: Number of threads scanning the subtrees below *root*.  The
+            scan is dominated by directory listing syscalls, which release
+            the GIL, so this helps on large or high-latency filesystems.  The
+            plan is identical for any value.
+
+    Returns:
+        A ``RenamePlan`` with ordered actions.
+
+    Raises:
+        ValueError: If *root* is not a directory.
+    """
+    root = _resolve_root(root)
+    plan = RenamePlan(root=root)
+    if workers <= 1:
+        plan.actions.extend(
+            iter_rename_actions(
+                root,
+                replace_char=replace_char,
+                max_length=max_length,
+                follow_symlinks=follow_symlinks,
+                case_insensitive=case_insensitive,
+                count_bytes=count_bytes,
+                plan=plan,
+            )
+        )
+        return plan
+
+    root_str = os.fspath(root)
+    try:
+        with os.scandir(root_str) as it:
+            root_entries = list(it)
+    except OSError:
+        return plan
+
+    # Every subtree of the root is independent (collisions are per directory),
+    # so each is planned into its own fragment.  Merging the fragments in
+    # listing order, then planning the root itself, gives exactly the serial
+    # post-order.
+    subdirs = [e.path for e in root_entries if _should_descend(e, follow_symlinks)]
+
+    settings = _PlanSettings(
+        replace_char=replace_char,
+        max_length=max_length,
+        follow_symlinks=follow_symlinks,
+        case_insensitive=case_insensitive,
+        count_bytes=count_bytes,
+    )
+
+    def plan_fragment(top: str) -> RenamePlan:
+        fragment = RenamePlan(root=root)
+        fragment.actions.extend(_plan_subtree(fragment, top, settings))
+        return fragment
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for fragment in executor.map(plan_fragment, subdirs):
+            plan.actions.extend(fragment.actions)
+            plan.warnings.extend(fragment.warnings)
+            plan.skipped_symlinks.extend(fragment.skipped_symlinks)
+            plan.total_entries_scanned += fragment.total_entries_scanned
+            plan.total_renames_needed += fragment.total_renames_needed
+
+    plan.actions.extend(_plan_directory(plan, root_str, root_entries, settings))
     return plan
+
+
+def iter_rename_actions(
+    root: Path,
+    *,
+    replace_char: str | None = None,
+    max_length: int = DEFAULT_MAX_NAME_LENGTH,
+    follow_symlinks: bool = False,
+    case_insensitive: bool = sys.platform in ("win32", "darwin"),
+    count_bytes: bool = sys.platform != "win32",
+    plan: RenamePlan | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> Iterator[RenameAction]:
+    """Walk the filesystem under *root* and yield rename actions as each directory is planned.
+
+    The streaming form of ``build_rename_plan``: actions come out in the same
+    execution order, one directory at a time, so callers can show progress
+    on large trees.  *root* is resolved and checked when this is called,
+    before the first action is requested.
+
+    Args:
+        root: Root directory to scan (must exist and be a directory).
+        replace_char: Character to replace forbidden characters with.
+        max_length: Maximum allowed filename length.
+        follow_symlinks: Whether to follow symbolic links.
+        case_insensitive: Whether names differing only in case collide.
+        count_bytes: Measure *max_length* in UTF-8 bytes rather than characters.
+        plan: Optional plan that collects the warnings, skipped symlinks and
+            counters as the walk goes.  Its ``root`` is set to the resolved
+            *root*; the actions are only yielded, so append them to
+            ``plan.actions`` to end up with a complete plan.
+        is_cancelled: Polled before each directory is listed or planned; once
+            it returns ``True`` the walk stops and no further actions are
+            yielded, leaving *plan* partially filled.
+
+    Returns:
+        An iterator of ``RenameAction`` objects, deepest directories first.
+
+    Raises:
+        ValueError: If *root* is not a directory.
+    """
+    root = _resolve_root(root)
+    if plan is None:
+        plan = RenamePlan(root=root)
+    else:
+        plan.root = root
+    settings = _PlanSettings(
+        replace_char=replace_char,
+        max_length=max_length,
+        follow_symlinks=follow_symlinks,
+        case_insensitive=case_insensitive,
+        count_bytes=count_bytes,
+    )
+    return _plan_subtree(plan, os.fspath(root), settings, is_cancelled)
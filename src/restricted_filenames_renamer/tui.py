@@ -11,6 +11,7 @@ from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     DataTable,
@@ -23,10 +24,20 @@ from textual.widgets import (
     Switch,
 )
 from textual.widgets.data_table import RowKey
+from textual.worker import get_current_worker  # pyright: ignore[reportUnknownVariableType]
 
 from .renamer import execute_plan, generate_log_filename
 from .sanitizer import ALL_RESTRICTED_CHARS, DEFAULT_MAX_NAME_LENGTH
-from .scanner import EntryKind, RenameAction, RenamePlan, build_rename_plan
+from .scanner import EntryKind, RenameAction, RenamePlan, iter_rename_actions
+
+# Rows are handed to the UI thread in batches while a scan is still running.
+_ROW_BATCH_SIZE = 200
+
+# Quiet period after the last edit of the replace char before re-scanning.
+_RESCAN_DEBOUNCE_SECONDS = 0.25
+
+# Scans use the scanner's platform default, same as the CLI's --max-length.
+_MAX_LENGTH_LABEL = "Max chars:" if sys.platform == "win32" else "Max bytes:"
 
 
 def _kind_label(kind: EntryKind) -> str:
@@ -111,6 +122,9 @@ class RenamerApp(App[int]):
         self.root: Path = root  # pyright: ignore[reportUnannotatedClassAttribute]
         self.current_plan: RenamePlan | None = None
         self.row_actions: dict[RowKey, RenameAction] = {}
+        self._rescan_timer: Timer | None = None
+        # Bumped per scan; UI callbacks from an older scan are dropped.
+        self._scan_generation: int = 0
 
     def compose(self) -> ComposeResult:  # pyright: ignore[reportImplicitOverride]
         yield Header()
@@ -122,11 +136,15 @@ class RenamerApp(App[int]):
                     placeholder="unicode default",
                     max_length=1,
                 )
-                yield Label("Max length:")
+                yield Label(_MAX_LENGTH_LABEL)
                 yield Input(
                     id="max-length",
                     value=str(DEFAULT_MAX_NAME_LENGTH),
                     type="integer",
+                    tooltip=(
+                        "Maximum filename length before truncation, in UTF-8 bytes "
+                        "(characters on Windows)."
+                    ),
                 )
                 yield Label("Follow symlinks:")
                 yield Switch(id="follow-symlinks", value=False)
@@ -179,6 +197,11 @@ class RenamerApp(App[int]):
         return replace_char, max_length, follow_symlinks
 
     def action_rescan(self) -> None:
+        # An explicit re-scan supersedes any pending debounced one.
+        if self._rescan_timer is not None:
+            self._rescan_timer.stop()
+            self._rescan_timer = None
+
         settings = self._read_settings()
         if settings is None:
             return
@@ -186,7 +209,8 @@ class RenamerApp(App[int]):
 
         self.query_one("#rename-table", DataTable).loading = True
         self.query_one("#apply-btn", Button).disabled = True
-        self.run_scan(replace_char, max_length, follow_symlinks)
+        self._scan_generation += 1
+        self.run_scan(self._scan_generation, replace_char, max_length, follow_symlinks)
 
     def action_apply(self) -> None:
         if self.current_plan is None or not self.current_plan.has_changes:
@@ -200,43 +224,97 @@ class RenamerApp(App[int]):
     @work(exclusive=True, thread=True)
     def run_scan(
         self,
+        generation: int,
         replace_char: str | None,
         max_length: int,
         follow_symlinks: bool,
     ) -> None:
-        plan = build_rename_plan(
-            self.root,
-            replace_char=replace_char,
-            max_length=max_length,
-            follow_symlinks=follow_symlinks,
-        )
-        self.call_from_thread(self._populate_table, plan)
+        worker = get_current_worker()  # pyright: ignore[reportUnknownVariableType]
+        plan = RenamePlan(root=self.root)
+        try:
+            actions = iter_rename_actions(
+                self.root,
+                replace_char=replace_char,
+                max_length=max_length,
+                follow_symlinks=follow_symlinks,
+                plan=plan,
+                is_cancelled=lambda: worker.is_cancelled,
+            )
+        except ValueError as exc:
+            if not worker.is_cancelled:
+                self.call_from_thread(self._fail_scan, generation, str(exc))
+            return
+        if worker.is_cancelled:
+            return
+        self.call_from_thread(self._clear_table, generation)
+
+        # Stream rows into the table as directories are planned, so large
+        # trees show progress instead of a blank table until the scan ends.
+        batch: list[RenameAction] = []
+        for action in actions:
+            if worker.is_cancelled:
+                return
+            plan.actions.append(action)
+            batch.append(action)
+            if len(batch) >= _ROW_BATCH_SIZE:
+                if worker.is_cancelled:
+                    return
+                self.call_from_thread(self._add_rows, generation, plan.root, batch)
+                batch = []
+        if batch:
+            if worker.is_cancelled:
+                return
+            self.call_from_thread(self._add_rows, generation, plan.root, batch)
+        if worker.is_cancelled:
+            return
+        self.call_from_thread(self._finish_scan, generation, plan)
 
-    def _populate_table(self, plan: RenamePlan) -> None:
-        self.current_plan = plan
+    def _clear_table(self, generation: int) -> None:
+        if generation != self._scan_generation:
+            return
+        self.current_plan = None
+        self.query_one("#rename-table", DataTable).clear()
+        self.row_actions.clear()
+
+    def _fail_scan(self, generation: int, message: str) -> None:
+        if generation != self._scan_generation:
+            return
+        self._clear_table(generation)
+        self.query_one("#rename-table", DataTable).loading = False
+        self.query_one("#log-output", RichLog).write(f"[red]Error:[/red] {message}")
+
+    def _add_rows(self, generation: int, root: Path, actions: list[RenameAction]) -> None:
+        if generation != self._scan_generation:
+            return
         table: DataTable[str] = self.query_one(  # pyright: ignore[reportUnknownVariableType]
             "#rename-table", DataTable
         )
-        table.clear()
-        self.row_actions.clear()
-
-        for action in plan.actions:
-            if not action.needs_rename:
-                continue
+        shown = [action for action in actions if action.needs_rename]
+        rows: list[tuple[str, str, str, str, str]] = []
+        for action in shown:
             try:
-                rel_dir = str(action.source.parent.relative_to(plan.root))
+                rel_dir = str(action.source.parent.relative_to(root))
             except ValueError:
                 rel_dir = str(action.source.parent)
-            row_key = table.add_row(  # pyright: ignore[reportUnknownMemberType]
-                _kind_label(action.kind),
-                action.original_name,
-                action.final_name,
-                rel_dir if rel_dir != "." else "(root)",
-                str(len(action.issues)),
+            rows.append(
+                (
+                    _kind_label(action.kind),
+                    action.original_name,
+                    action.final_name,
+                    rel_dir if rel_dir != "." else "(root)",
+                    str(len(action.issues)),
+                )
             )
-            self.row_actions[row_key] = action
-
+        # One add_rows call refreshes the table once per batch, not once per row.
+        row_keys = table.add_rows(rows)  # pyright: ignore[reportUnknownMemberType]
+        self.row_actions.update(zip(row_keys, shown, strict=True))
         table.loading = False
+
+    def _finish_scan(self, generation: int, plan: RenamePlan) -> None:
+        if generation != self._scan_generation:
+            return
+        self.current_plan = plan
+        self.query_one("#rename-table", DataTable).loading = False
         self.query_one("#apply-btn", Button).disabled = not plan.has_changes
 
         # Update detail panel
@@ -278,7 +356,8 @@ class RenamerApp(App[int]):
                 else:
                     failures += 1
                     log.write(f"[red]FAIL[/red] {r.action.original_name}: {r.error_message}")
-            log.write(f"\nDone: {successes} renamed, {failures} errors. Log: {log_path}")
+            summary = f"\nDone: {successes} renamed, {failures} errors."
+            log.write(f"{summary} Log: {log_path}" if results else summary)
 
             self.query_one("#apply-btn", Button).disabled = True
             self.query_one("#rescan-btn", Button).disabled = False
@@ -313,6 +392,28 @@ class RenamerApp(App[int]):
         elif event.button.id == "apply-btn":
             self.action_apply()
 
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Re-scan once the replace char has stopped changing, not on every keystroke."""
+        if event.input.id != "replace-char":
+            return
+        if self._rescan_timer is not None:
+            self._rescan_timer.stop()
+        self._rescan_timer = self.set_timer(_RESCAN_DEBOUNCE_SECONDS, self._debounced_rescan)
+
+    def on_unmount(self) -> None:
+        if self._rescan_timer is not None:
+            self._rescan_timer.stop()
+            self._rescan_timer = None
+
+    def _debounced_rescan(self) -> None:
+        self._rescan_timer = None
+        # The timer can still fire while the app is shutting down.
+        if not self.is_running:
+            return
+        # Re-scan is disabled while renames are being applied.
+        if not self.query_one("#rescan-btn", Button).disabled:
+            self.action_rescan()
+
 
 def tui_main(argv: list[str] | None = None) -> int:
     """CLI entry point for the TUI."""
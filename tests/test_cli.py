@@ -84,6 +84,15 @@ class TestCLIOptions:
         assert exit_code == 0
         assert (tmp_path / "a-b.txt").exists()
 
+    def test_replace_char_dot_on_dots_only_name(self, tmp_path: Path) -> None:
+        """'...' would sanitize to '.'; the run must not crash."""
+        (tmp_path / "...").touch()
+
+        exit_code = main([str(tmp_path), "--write", "--yes", "--replace-char", "."])
+
+        assert exit_code == 0
+        assert (tmp_path / "...").exists()
+
     def test_verbose(self, tmp_path: Path) -> None:
         (tmp_path / "file:name.txt").touch()
 
@@ -113,6 +122,26 @@ class TestCLIOptions:
         assert len(txt_files) == 1
         assert len(txt_files[0].name) <= 20
 
+    def test_ndjson_log_format(self, tmp_path: Path) -> None:
+        (tmp_path / "a:b.txt").touch()
+        log_file = tmp_path / "log.ndjson"
+
+        exit_code = main(
+            [
+                str(tmp_path),
+                "--write",
+                "--yes",
+                "--log-file",
+                str(log_file),
+                "--log-format",
+                "ndjson",
+            ]
+        )
+
+        assert exit_code == 0
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 2  # header + one rename
+
     def test_default_unicode_mode(self, tmp_path: Path) -> None:
         """Default mode uses Unicode fullwidth replacements, not underscore."""
         (tmp_path / "file:name.txt").touch()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 
 class TestPublicAPI:
     def test_sanitizer_functions_importable(self) -> None:
@@ -30,6 +32,7 @@ class TestPublicAPI:
             UNICODE_CHAR_MAP,
             UNICODE_DOT_REPLACEMENT,
             UNICODE_SPACE_REPLACEMENT,
+            UNICODE_TRANSLATE_TABLE,
             WINDOWS_MAX_PATH,
         )
 
@@ -37,11 +40,18 @@ class TestPublicAPI:
         assert len(CONTROL_CHARS) == 32
         assert ALL_RESTRICTED_CHARS == FORBIDDEN_CHARS | CONTROL_CHARS
         assert len(UNICODE_CHAR_MAP) == 41  # 9 + 32
+        assert UNICODE_TRANSLATE_TABLE == str.maketrans(UNICODE_CHAR_MAP)
         assert isinstance(UNICODE_DOT_REPLACEMENT, str)
         assert isinstance(UNICODE_SPACE_REPLACEMENT, str)
         assert DEFAULT_MAX_NAME_LENGTH == 255
         assert WINDOWS_MAX_PATH == 260
 
+    def test_translate_table_is_read_only(self) -> None:
+        from restricted_filenames_renamer import UNICODE_TRANSLATE_TABLE
+
+        with pytest.raises(TypeError):
+            UNICODE_TRANSLATE_TABLE[ord(":")] = "_"  # pyright: ignore[reportIndexIssue]
+
     def test_scanner_classes_importable(self) -> None:
         from restricted_filenames_renamer import (
             EntryKind,
@@ -56,9 +66,14 @@ class TestPublicAPI:
         assert RenameResult is not None
 
     def test_scanner_functions_importable(self) -> None:
-        from restricted_filenames_renamer import build_rename_plan, validate_path_under_root
+        from restricted_filenames_renamer import (
+            build_rename_plan,
+            iter_rename_actions,
+            validate_path_under_root,
+        )
 
         assert callable(build_rename_plan)
+        assert callable(iter_rename_actions)
         assert callable(validate_path_under_root)
 
     def test_renamer_functions_importable(self) -> None:
@@ -66,12 +81,14 @@ class TestPublicAPI:
             execute_plan,
             format_plan_summary,
             generate_log_filename,
+            iter_plan_summary,
             write_rename_log,
         )
 
         assert callable(execute_plan)
         assert callable(format_plan_summary)
         assert callable(generate_log_filename)
+        assert callable(iter_plan_summary)
         assert callable(write_rename_log)
 
     def test_main_still_importable(self) -> None:
@@ -94,6 +111,7 @@ class TestPublicAPI:
             "CONTROL_CHARS",
             "ALL_RESTRICTED_CHARS",
             "UNICODE_CHAR_MAP",
+            "UNICODE_TRANSLATE_TABLE",
             "UNICODE_DOT_REPLACEMENT",
             "UNICODE_SPACE_REPLACEMENT",
             "DEFAULT_MAX_NAME_LENGTH",
@@ -103,10 +121,12 @@ class TestPublicAPI:
             "RenamePlan",
             "RenameResult",
             "build_rename_plan",
+            "iter_rename_actions",
             "validate_path_under_root",
             "execute_plan",
             "format_plan_summary",
             "generate_log_filename",
+            "iter_plan_summary",
             "write_rename_log",
             "tui_main",
         }
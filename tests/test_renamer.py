@@ -3,15 +3,39 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
+import pytest
+
+from restricted_filenames_renamer import renamer
 from restricted_filenames_renamer.renamer import (
     execute_plan,
     format_plan_summary,
     generate_log_filename,
+    iter_plan_summary,
     write_rename_log,
 )
-from restricted_filenames_renamer.scanner import build_rename_plan
+from restricted_filenames_renamer.scanner import (
+    EntryKind,
+    RenameAction,
+    RenameResult,
+    build_rename_plan,
+)
+
+
+def _renamed(source: Path, final_name: str) -> RenameResult:
+    """Return a successful result for renaming *source* to *final_name*."""
+    action = RenameAction(
+        source=source,
+        destination=source.with_name(final_name),
+        kind=EntryKind.FILE,
+        original_name=source.name,
+        final_name=final_name,
+        issues=(),
+        needs_rename=True,
+    )
+    return RenameResult(action=action, success=True)
 
 
 class TestExecutePlan:
@@ -62,6 +86,40 @@ class TestExecutePlan:
         assert all(r.success for r in results)
         assert (tmp_path / "a_dir" / "b_dir" / "c_file.txt").exists()
 
+    def test_shuffled_plan_still_renames_bottom_up(self, tmp_path: Path) -> None:
+        """Execution order does not depend on the order of ``plan.actions``."""
+        deep = tmp_path / "a:dir" / "b:dir"
+        deep.mkdir(parents=True)
+        (deep / "c:file.txt").touch()
+        (tmp_path / "a:dir" / "d:file.txt").touch()
+
+        plan = build_rename_plan(tmp_path)
+        plan.actions.reverse()
+        results = execute_plan(plan)
+
+        assert all(r.success for r in results)
+        assert (tmp_path / "a\uff1adir" / "b\uff1adir" / "c\uff1afile.txt").exists()
+        assert (tmp_path / "a\uff1adir" / "d\uff1afile.txt").exists()
+
+    def test_parallel_matches_serial(self, tmp_path: Path) -> None:
+        for mode in ("serial", "parallel"):
+            root = tmp_path / mode
+            for i in range(5):
+                sub = root / f"d:{i}"
+                sub.mkdir(parents=True)
+                for j in range(3):
+                    (sub / f"f:{j}.txt").touch()
+
+            plan = build_rename_plan(root)
+            results = execute_plan(plan, parallel=mode == "parallel")
+
+            assert len(results) == 20
+            assert all(r.success for r in results)
+            renamed = sorted(p.relative_to(root).as_posix() for p in root.rglob("*"))
+            assert renamed[0] == "d\uff1a0"
+            assert "d\uff1a4/f\uff1a2.txt" in renamed
+            assert not any(":" in name for name in renamed)
+
     def test_writes_log_file(self, tmp_path: Path) -> None:
         (tmp_path / "file:name.txt").touch()
         log_file = tmp_path / "test_log.json"
@@ -88,12 +146,86 @@ class TestExecutePlan:
         assert not results[0].success
         assert "no longer exists" in (results[0].error_message or "")
 
+    def test_source_missing_reported_before_existing_destination(self, tmp_path: Path) -> None:
+        (tmp_path / "file:name.txt").touch()
+        plan = build_rename_plan(tmp_path)
+        (tmp_path / "file:name.txt").rename(tmp_path / "file\uff1aname.txt")
+
+        results = execute_plan(plan)
+        assert not results[0].success
+        assert "no longer exists" in (results[0].error_message or "")
+
+    def test_rejected_destination_records_error(self, tmp_path: Path) -> None:
+        """A destination name the filesystem rejects is recorded, not raised."""
+        (tmp_path / (":" * 100)).touch()  # Sanitizes to 300 UTF-8 bytes.
+
+        plan = build_rename_plan(tmp_path, count_bytes=False)
+        results = execute_plan(plan)
+
+        assert len(results) == 1
+        assert not results[0].success
+        assert str(tmp_path) in (results[0].error_message or "")
+
+    @pytest.mark.skipif(os.rename not in os.supports_dir_fd, reason="rename has no dir_fd support")
+    def test_renames_relative_to_parent_fd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / "file:name.txt").touch()
+        plan = build_rename_plan(tmp_path)
+
+        calls: list[tuple[object, object, int | None]] = []
+        rename = os.rename
+
+        def recording_rename(
+            src: str, dst: str, *, src_dir_fd: int | None = None, dst_dir_fd: int | None = None
+        ) -> None:
+            calls.append((src, dst, src_dir_fd))
+            rename(src, dst, src_dir_fd=src_dir_fd, dst_dir_fd=dst_dir_fd)
+
+        monkeypatch.setattr(os, "rename", recording_rename)
+        results = execute_plan(plan)
+
+        assert results[0].success
+        assert len(calls) == 1
+        src, dst, src_dir_fd = calls[0]
+        assert (src, dst) == ("file:name.txt", "file\uff1aname.txt")
+        assert src_dir_fd is not None
+
+    def test_destination_exists_records_error(self, tmp_path: Path) -> None:
+        """An entry created at the destination after scanning is never overwritten."""
+        (tmp_path / "file:name.txt").write_text("source")
+
+        plan = build_rename_plan(tmp_path)
+        (tmp_path / "file\uff1aname.txt").write_text("existing")
+
+        results = execute_plan(plan)
+        assert len(results) == 1
+        assert not results[0].success
+        assert "already exists" in (results[0].error_message or "")
+        assert (tmp_path / "file\uff1aname.txt").read_text() == "existing"
+
+    def test_dangling_symlink_destination_records_error(self, tmp_path: Path) -> None:
+        (tmp_path / "file:name.txt").touch()
+
+        plan = build_rename_plan(tmp_path)
+        (tmp_path / "file\uff1aname.txt").symlink_to(tmp_path / "missing")
+
+        results = execute_plan(plan)
+        assert not results[0].success
+        assert (tmp_path / "file:name.txt").exists()
+
     def test_no_changes_no_results(self, tmp_path: Path) -> None:
         (tmp_path / "clean.txt").touch()
         plan = build_rename_plan(tmp_path)
         results = execute_plan(plan)
         assert results == []
 
+    def test_no_results_skips_log(self, tmp_path: Path) -> None:
+        (tmp_path / "clean.txt").touch()
+        log_file = tmp_path / "logs" / "log.json"
+        execute_plan(build_rename_plan(tmp_path), log_file=log_file)
+        assert not log_file.parent.exists()
+
 
 class TestFormatPlanSummary:
     def test_no_changes(self, tmp_path: Path) -> None:
@@ -118,6 +250,14 @@ class TestFormatPlanSummary:
         summary = format_plan_summary(plan, verbose=True)
         assert "forbidden" in summary.lower() or "Replaced" in summary
 
+    def test_iter_matches_format(self, tmp_path: Path) -> None:
+        (tmp_path / "file:name.txt").touch()
+        plan = build_rename_plan(tmp_path)
+
+        lines = list(iter_plan_summary(plan, verbose=True))
+        assert "\n".join(lines) == format_plan_summary(plan, verbose=True)
+        assert not any("\n" in line for line in lines)
+
 
 class TestWriteRenameLog:
     def test_log_structure(self, tmp_path: Path) -> None:
@@ -136,6 +276,74 @@ class TestWriteRenameLog:
         assert data["total_renames"] == 1
         assert data["total_errors"] == 0
 
+    def test_ndjson_structure(self, tmp_path: Path) -> None:
+        (tmp_path / "a:b.txt").touch()
+        (tmp_path / "c:d.txt").touch()
+        log_file = tmp_path / "log.ndjson"
+
+        plan = build_rename_plan(tmp_path)
+        (tmp_path / "c:d.txt").unlink()
+        results = execute_plan(plan)
+        write_rename_log(results, tmp_path, log_file, log_format="ndjson")
+
+        header, *records = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert header["root"] == str(tmp_path)
+        assert header["total_renames"] == 1
+        assert header["total_errors"] == 1
+        assert len(records) == 2
+        assert {r["status"] for r in records} == {"renamed", "error"}
+
+    def test_unknown_format_rejected(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="Unknown log format"):
+            write_rename_log([], tmp_path, tmp_path / "log.txt", log_format="xml")  # pyright: ignore[reportArgumentType]
+
+    @pytest.mark.parametrize("log_format", ["json", "ndjson"])
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_non_utf8_name_logged(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        log_format: renamer.LogFormat,
+        use_orjson: bool,
+    ) -> None:
+        """Names that are not valid UTF-8 (surrogateescape) are logged, with or without orjson."""
+        monkeypatch.setattr(
+            renamer, "orjson", pytest.importorskip("orjson") if use_orjson else None
+        )
+        source = tmp_path / os.fsdecode(b"bad\x80:name.txt")
+        log_file = tmp_path / "log"
+
+        write_rename_log(
+            [_renamed(source, "bad\udc80\uff1aname.txt")], tmp_path, log_file, log_format=log_format
+        )
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        record = (
+            json.loads(lines[1])
+            if log_format == "ndjson"
+            else json.loads("".join(lines))["renames"][0]
+        )
+        assert record["source"] == str(source)
+
+    def test_orjson_output_decodes_like_stdlib(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        orjson_module = pytest.importorskip("orjson")
+        results = [_renamed(tmp_path / "caf\u00e9:x.txt", "caf\u00e9\uff1ax.txt")]
+        logs: list[list[object]] = []
+        for module in (None, orjson_module):
+            monkeypatch.setattr(renamer, "orjson", module)
+            log_file = tmp_path / "log.ndjson"
+            write_rename_log(results, tmp_path, log_file, log_format="ndjson")
+            lines = log_file.read_text(encoding="utf-8").splitlines()
+            logs.append([json.loads(line) for line in lines[1:]])  # Skip the timestamped header.
+        assert logs[0] == logs[1]
+
+    def test_empty_results_write_nothing(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "logs" / "log.json"
+        write_rename_log([], tmp_path, log_file)
+        assert not log_file.parent.exists()
+
 
 class TestGenerateLogFilename:
     def test_format(self) -> None:
@@ -85,6 +85,12 @@ class TestReplaceForbiddenChars:
         assert len(issues) == 1
         assert "forbidden" in issues[0].lower() or "control" in issues[0].lower()
 
+    def test_issue_lists_each_replaced_char_once(self) -> None:
+        _, issues = replace_forbidden_chars("a\x01:b\x01:\t")
+        assert issues == [
+            "Replaced forbidden characters [':'], control characters ['0x01', '0x09']"
+        ]
+
     def test_each_char_maps_to_unique_unicode(self) -> None:
         """Every restricted char should map to a distinct Unicode character."""
         values = list(UNICODE_CHAR_MAP.values())
@@ -259,6 +265,11 @@ class TestHandleReservedNames:
         assert result == "COM10"
         assert issues == []
 
+    def test_not_reserved_non_ascii_digit(self) -> None:
+        result, issues = handle_reserved_names("COM\u0661")  # ARABIC-INDIC DIGIT ONE
+        assert result == "COM\u0661"
+        assert issues == []
+
     def test_not_reserved_lpt(self) -> None:
         result, issues = handle_reserved_names("LPT")
         assert result == "LPT"
@@ -320,6 +331,19 @@ class TestTruncateName:
         assert len(result) == 255
         assert result.startswith(".")
 
+    def test_count_bytes_keeps_multibyte_chars_whole(self) -> None:
+        name = "\uff1a" * 100 + ".txt"  # 304 bytes, 104 characters
+        assert truncate_name(name, 255) == (name, [])
+        result, issues = truncate_name(name, 255, count_bytes=True)
+        assert result == "\uff1a" * 83 + ".txt"
+        assert len(result.encode("utf-8")) <= 255
+        assert len(issues) == 1
+
+    def test_count_bytes_ascii_matches_characters(self) -> None:
+        name = "a" * 260 + ".txt"
+        result, _ = truncate_name(name, 255, count_bytes=True)
+        assert result == truncate_name(name, 255)[0]
+
 
 # ---------------------------------------------------------------------------
 # sanitize_name (full pipeline, Unicode mode)
@@ -362,6 +386,22 @@ class TestSanitizeName:
         result, _ = sanitize_name(".env")
         assert result == ".env"
 
+    def test_cached_issues_not_shared(self) -> None:
+        """Mutating a returned issue list must not leak into later (cached) calls."""
+        _, issues = sanitize_name("cache:me")
+        issues.append("extra")
+        _, issues_again = sanitize_name("cache:me")
+        assert "extra" not in issues_again
+        assert len(issues_again) == 1
+
+    def test_count_bytes_fits_replacements(self) -> None:
+        name = ":" * 100 + ".txt"
+        result, _ = sanitize_name(name)
+        assert len(result.encode("utf-8")) > 255
+        result, issues = sanitize_name(name, count_bytes=True)
+        assert result == "\uff1a" * 83 + ".txt"
+        assert len(issues) == 2
+
 
 # ---------------------------------------------------------------------------
 # sanitize_name (override mode with --replace-char)
@@ -415,3 +455,21 @@ class TestIsNameSafe:
 
     def test_safe_long_name_within_limit(self) -> None:
         assert is_name_safe("a" * 255) is True
+
+    def test_unsafe_control_char(self) -> None:
+        assert is_name_safe("file\x1fname") is False
+
+    def test_unsafe_reserved_with_extension(self) -> None:
+        assert is_name_safe("com1.txt") is False
+
+    def test_unsafe_custom_max_length(self) -> None:
+        assert is_name_safe("abcdef", max_length=5) is False
+
+    def test_count_bytes(self) -> None:
+        assert is_name_safe("\u00e9" * 200) is True
+        assert is_name_safe("\u00e9" * 200, count_bytes=True) is False
+
+    def test_agrees_with_sanitize_name(self) -> None:
+        names = ["", ".", "a b", "a.b.", "CON.", "LPT", "x:y", ".env", "nul.tar.gz", "a" * 256]
+        for name in names:
+            assert is_name_safe(name) == (sanitize_name(name)[0] == name), name
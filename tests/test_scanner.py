@@ -8,7 +8,9 @@ import pytest
 
 from restricted_filenames_renamer.scanner import (
     EntryKind,
+    RenamePlan,
     build_rename_plan,
+    iter_rename_actions,
     validate_path_under_root,
 )
 
@@ -128,6 +130,46 @@ class TestBuildRenamePlan:
         assert action.original_name == "a:b.txt"
         assert action.final_name == "a_b_1.txt"
 
+    def test_case_insensitive_collision(self, tmp_path: Path) -> None:
+        """Names differing only in case collide when case_insensitive is set."""
+        (tmp_path / "A_B.txt").touch()
+        (tmp_path / "a:b.txt").touch()
+
+        sensitive = build_rename_plan(tmp_path, replace_char="_", case_insensitive=False)
+        insensitive = build_rename_plan(tmp_path, replace_char="_", case_insensitive=True)
+
+        assert sensitive.actions[0].final_name == "a_b.txt"
+        assert insensitive.actions[0].final_name == "a_b_1.txt"
+
+    def test_many_collisions_get_consecutive_suffixes(self, tmp_path: Path) -> None:
+        """Entries sharing one target name skip over suffixes that are already taken."""
+        (tmp_path / "a_b_2.txt").touch()
+        for c in ':*?<>|"':
+            (tmp_path / f"a{c}b.txt").touch()
+
+        plan = build_rename_plan(tmp_path, replace_char="_")
+
+        assert sorted(a.final_name for a in plan.actions) == [
+            "a_b.txt",
+            "a_b_1.txt",
+            "a_b_3.txt",
+            "a_b_4.txt",
+            "a_b_5.txt",
+            "a_b_6.txt",
+            "a_b_7.txt",
+        ]
+
+    def test_byte_length_limit(self, tmp_path: Path) -> None:
+        """With count_bytes, multi-byte replacements are truncated (and suffixed) to fit."""
+        (tmp_path / ("\uff1a" * 84 + ".md")).touch()  # Exactly 255 bytes.
+        (tmp_path / (":" * 100 + ".md")).touch()
+
+        by_chars = build_rename_plan(tmp_path, count_bytes=False)
+        by_bytes = build_rename_plan(tmp_path, count_bytes=True)
+
+        assert [a.final_name for a in by_chars.actions] == ["\uff1a" * 100 + ".md"]
+        assert [a.final_name for a in by_bytes.actions] == ["\uff1a" * 83 + "_1.md"]
+
     def test_symlink_skipped_by_default(self, tmp_path: Path) -> None:
         """Symlinks are reported but not processed by default."""
         target = tmp_path / "target.txt"
@@ -140,6 +182,23 @@ class TestBuildRenamePlan:
         assert len(plan.skipped_symlinks) == 1
         assert plan.skipped_symlinks[0] == link
 
+    def test_symlinked_directory_followed(self, tmp_path: Path) -> None:
+        """With follow_symlinks, a linked directory is renamed as a symlink and scanned."""
+        target = tmp_path / "target"
+        target.mkdir()
+        (target / "a:b.txt").touch()
+        (tmp_path / "link:dir").symlink_to(target, target_is_directory=True)
+
+        plan = build_rename_plan(tmp_path, follow_symlinks=True)
+
+        kinds = {a.source.relative_to(tmp_path).as_posix(): a.kind for a in plan.actions}
+        assert kinds == {
+            "link:dir": EntryKind.SYMLINK,
+            "link:dir/a:b.txt": EntryKind.FILE,
+            "target/a:b.txt": EntryKind.FILE,
+        }
+        assert plan.skipped_symlinks == []
+
     def test_directory_rename(self, tmp_path: Path) -> None:
         """Directories with forbidden chars are planned for renaming."""
         (tmp_path / "bad:dir").mkdir()
@@ -158,6 +217,62 @@ class TestBuildRenamePlan:
 
         assert plan.actions[0].final_name == "a-b.txt"
 
+    def test_followed_link_outside_root_rejected(self, tmp_path: Path) -> None:
+        """Renames reached through a link leading out of the root are refused."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "a:b.txt").touch()
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "link").symlink_to(outside, target_is_directory=True)
+
+        with pytest.raises(ValueError, match="not under root"):
+            build_rename_plan(root, follow_symlinks=True)
+
+    def test_degenerate_final_name_reported_not_raised(self, tmp_path: Path) -> None:
+        """A name that sanitizes to "." is left alone with a warning."""
+        (tmp_path / "...").touch()
+        (tmp_path / "a:b").touch()
+
+        plan = build_rename_plan(tmp_path, replace_char=".")
+
+        assert [a.final_name for a in plan.actions] == ["a.b"]
+        assert plan.total_renames_needed == 1
+        assert any("'.' is not a valid name" in w for w in plan.warnings)
+
+    def test_workers_match_serial_plan(self, tmp_path: Path) -> None:
+        """Scanning subtrees on several threads yields the same ordered plan."""
+        for top in ("a:1", "b", "c?3"):
+            for sub in ("x", "y*", "z."):
+                (tmp_path / top / sub).mkdir(parents=True)
+                (tmp_path / top / sub / "f:1.txt").touch()
+        (tmp_path / "root|file.txt").touch()
+
+        serial = build_rename_plan(tmp_path)
+        parallel = build_rename_plan(tmp_path, workers=4)
+
+        assert parallel.actions == serial.actions
+        assert parallel.total_entries_scanned == serial.total_entries_scanned
+        assert parallel.total_renames_needed == serial.total_renames_needed
+
+    def test_long_path_warnings(self, tmp_path: Path) -> None:
+        """Paths over MAX_PATH are reported for renamed and untouched entries alike."""
+        deep = tmp_path.resolve() / ("d" * 150)
+        deep.mkdir()
+        clean = deep / ("c" * 120)
+        dirty = deep / ("x" * 119 + ":")
+        (deep / "short").touch()
+        clean.touch()
+        dirty.touch()
+
+        plan = build_rename_plan(tmp_path)
+
+        destination = plan.actions[0].destination
+        assert sorted(plan.warnings) == sorted(
+            f"Path length {len(str(p))} exceeds Windows MAX_PATH (260): {p}"
+            for p in (clean, destination)
+        )
+
     def test_empty_directory(self, tmp_path: Path) -> None:
         plan = build_rename_plan(tmp_path)
 
@@ -173,6 +288,70 @@ class TestBuildRenamePlan:
         assert not plan.has_changes
 
 
+class TestIterRenameActions:
+    def test_matches_build_rename_plan(self, tmp_path: Path) -> None:
+        (tmp_path / "a:dir").mkdir()
+        (tmp_path / "a:dir" / "b*c.txt").touch()
+        (tmp_path / "a:dir" / "clean.txt").touch()
+        (tmp_path / "CON").touch()
+        (tmp_path / "link").symlink_to(tmp_path / "CON")
+
+        expected = build_rename_plan(tmp_path)
+        plan = RenamePlan(root=tmp_path)
+        actions = list(iter_rename_actions(tmp_path, plan=plan))
+
+        assert actions == expected.actions
+        assert plan.actions == []  # Left to the caller.
+        assert plan.skipped_symlinks == expected.skipped_symlinks
+        assert plan.total_entries_scanned == expected.total_entries_scanned
+        assert plan.total_renames_needed == expected.total_renames_needed
+
+    def test_is_lazy(self, tmp_path: Path) -> None:
+        (tmp_path / "a:dir").mkdir()
+        (tmp_path / "a:dir" / "b*c.txt").touch()
+        (tmp_path / "d?e.txt").touch()
+
+        plan = RenamePlan(root=tmp_path)
+        actions = iter_rename_actions(tmp_path, plan=plan)
+
+        assert plan.total_entries_scanned == 0
+        assert next(actions).original_name == "b*c.txt"
+        assert plan.total_entries_scanned == 1
+
+    def test_relative_root_with_symlinks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / "top" / "d").mkdir(parents=True)
+        (tmp_path / "top" / "d" / "a:b").touch()
+        monkeypatch.chdir(tmp_path)
+
+        plan = RenamePlan(root=Path("top"))
+        actions = list(iter_rename_actions(Path("top"), follow_symlinks=True, plan=plan))
+
+        assert plan.root == (tmp_path / "top").resolve()
+        assert [a.final_name for a in actions] == ["a\uff1ab"]
+
+    def test_file_root_rejected(self, tmp_path: Path) -> None:
+        f = tmp_path / "file.txt"
+        f.touch()
+        with pytest.raises(ValueError, match="not a directory"):
+            iter_rename_actions(f)  # Checked on the call, not on first next().
+
+    def test_cancel_stops_walk_between_directories(self, tmp_path: Path) -> None:
+        (tmp_path / "a:dir").mkdir()
+        (tmp_path / "a:dir" / "b*c.txt").touch()
+        (tmp_path / "d?e.txt").touch()
+
+        cancelled = False
+        plan = RenamePlan(root=tmp_path)
+        actions = iter_rename_actions(tmp_path, plan=plan, is_cancelled=lambda: cancelled)
+
+        assert next(actions).original_name == "b*c.txt"
+        cancelled = True
+        assert list(actions) == []
+        assert plan.total_entries_scanned == 1  # The root was never planned.
+
+
 class TestValidatePathUnderRoot:
     def test_valid_path(self, tmp_path: Path) -> None:
         child = tmp_path / "subdir" / "file.txt"
@@ -191,3 +370,8 @@ class TestValidatePathUnderRoot:
         fake = Path(str(tmp_path) + "-other")
         with pytest.raises(ValueError, match="not under root"):
             validate_path_under_root(fake, tmp_path)
+
+    def test_accepts_str_paths(self, tmp_path: Path) -> None:
+        validate_path_under_root(str(tmp_path / "file.txt"), str(tmp_path))
+        with pytest.raises(ValueError, match="not under root"):
+            validate_path_under_root(str(tmp_path.parent), str(tmp_path))
@@ -2,14 +2,34 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import pytest
-from textual.widgets import Button, DataTable, Input, Static
+from textual.timer import Timer
+from textual.widgets import Button, DataTable, Input, Label, RichLog, Static
 
 from restricted_filenames_renamer.tui import RenamerApp, tui_main
 
 
+def _hold_timers(app: RenamerApp, monkeypatch: pytest.MonkeyPatch) -> list[Callable[[], object]]:
+    """Stop *app*'s timers from firing on their own; return their callbacks to fire by hand."""
+    callbacks: list[Callable[[], object]] = []
+    set_timer = app.set_timer
+
+    def held_set_timer(
+        _delay: float, callback: Callable[[], object] | None = None, **kwargs: Any
+    ) -> Timer:
+        if callback is not None:
+            callbacks.append(callback)
+        return set_timer(3600, callback, **kwargs)
+
+    monkeypatch.setattr(app, "set_timer", held_set_timer)
+    return callbacks
+
+
 class TestRenamerApp:
     @pytest.fixture
     def clean_dir(self, tmp_path: Path) -> Path:
@@ -48,6 +68,21 @@ class TestRenamerApp:
             apply_btn = app.query_one("#apply-btn", Button)
             assert apply_btn.disabled is False
 
+    @pytest.mark.asyncio
+    async def test_large_scan_streams_all_rows(self, tmp_path: Path) -> None:
+        for i in range(450):  # More than two row batches.
+            (tmp_path / f"file:{i}.txt").touch()
+        app = RenamerApp(root=tmp_path)
+        async with app.run_test(size=(120, 40)) as pilot:
+            await app.workers.wait_for_complete()  # pyright: ignore[reportUnknownMemberType]
+            await pilot.pause()
+            table: DataTable[str] = app.query_one(  # pyright: ignore[reportUnknownVariableType]
+                "#rename-table", DataTable
+            )
+            assert table.row_count == 450
+            assert app.current_plan is not None
+            assert len(app.current_plan.actions) == 450
+
     @pytest.mark.asyncio
     async def test_rescan_with_replace_char(self, dirty_dir: Path) -> None:
         app = RenamerApp(root=dirty_dir)
@@ -56,8 +91,10 @@ class TestRenamerApp:
             # Change replace-char setting
             replace_input = app.query_one("#replace-char", Input)
             replace_input.value = "-"
-            # Click re-scan
+            await pilot.pause()
+            # Click re-scan (which also supersedes the pending debounced one)
             await pilot.click("#rescan-btn")
+            await app.workers.wait_for_complete()  # pyright: ignore[reportUnknownMemberType]
             await pilot.pause()
             # Table should still show renames
             table: DataTable[str] = app.query_one(  # pyright: ignore[reportUnknownVariableType]
@@ -65,6 +102,83 @@ class TestRenamerApp:
             )
             assert table.row_count == 2
 
+    @pytest.mark.asyncio
+    async def test_editing_replace_char_rescans_once(
+        self, dirty_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        app = RenamerApp(root=dirty_dir)
+        async with app.run_test(size=(120, 40)) as pilot:
+            await app.workers.wait_for_complete()  # pyright: ignore[reportUnknownMemberType]
+            timer_callbacks = _hold_timers(app, monkeypatch)
+            scans: list[object] = []
+            run_scan = app.run_scan
+
+            def counting_run_scan(*args: object) -> object:
+                scans.append(args)
+                return run_scan(*args)  # pyright: ignore[reportArgumentType]
+
+            monkeypatch.setattr(app, "run_scan", counting_run_scan)
+            replace_input = app.query_one("#replace-char", Input)
+            for value in ("-", "+", "~", "_"):
+                replace_input.value = value
+                await pilot.pause()
+            assert scans == []  # Each edit only restarts the debounce timer.
+            assert len(timer_callbacks) == 4
+
+            timer_callbacks[-1]()  # The quiet period after the last edit ends.
+            await app.workers.wait_for_complete()  # pyright: ignore[reportUnknownMemberType]
+            await pilot.pause()
+            assert len(scans) == 1
+            assert app.current_plan is not None
+            assert "file_name.txt" in {a.final_name for a in app.current_plan.actions}
+
+    @pytest.mark.asyncio
+    async def test_superseded_scan_does_not_touch_table(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        for i in range(450):
+            (tmp_path / f"file:{i}.txt").touch()
+        app = RenamerApp(root=tmp_path)
+        async with app.run_test(size=(120, 40)) as pilot:
+            await app.workers.wait_for_complete()  # pyright: ignore[reportUnknownMemberType]
+            _hold_timers(app, monkeypatch)  # Only the explicit re-scans below run.
+            replace_input = app.query_one("#replace-char", Input)
+            replace_input.value = "-"
+            app.action_rescan()
+            replace_input.value = "_"
+            app.action_rescan()  # Cancels the "-" scan mid-flight.
+            latest = [w for w in app.workers if not w.is_cancelled]
+            await app.workers.wait_for_complete(latest)  # pyright: ignore[reportUnknownMemberType]
+            await pilot.pause()
+            table: DataTable[str] = app.query_one(  # pyright: ignore[reportUnknownVariableType]
+                "#rename-table", DataTable
+            )
+            assert table.row_count == 450
+            assert app.current_plan is not None
+            assert {a.final_name for a in app.current_plan.actions} == {
+                f"file_{i}.txt" for i in range(450)
+            }
+
+    @pytest.mark.asyncio
+    async def test_rescan_of_removed_root_reports_error(self, tmp_path: Path) -> None:
+        root = tmp_path / "root"
+        (root / "file:name.txt").mkdir(parents=True)
+        app = RenamerApp(root=root)
+        async with app.run_test(size=(120, 40)) as pilot:
+            await app.workers.wait_for_complete()  # pyright: ignore[reportUnknownMemberType]
+            (root / "file:name.txt").rmdir()
+            root.rmdir()
+            app.action_rescan()
+            await app.workers.wait_for_complete()  # pyright: ignore[reportUnknownMemberType]
+            await pilot.pause()
+            table: DataTable[str] = app.query_one(  # pyright: ignore[reportUnknownVariableType]
+                "#rename-table", DataTable
+            )
+            assert table.row_count == 0
+            assert app.current_plan is None
+            lines = [str(line.text) for line in app.query_one("#log-output", RichLog).lines]
+            assert any("not a directory" in line for line in lines)
+
     @pytest.mark.asyncio
     async def test_apply_renames_files(self, dirty_dir: Path) -> None:
         app = RenamerApp(root=dirty_dir)
@@ -101,6 +215,17 @@ class TestRenamerApp:
             # The row_actions mapping should be populated
             assert len(app.row_actions) > 0
 
+    @pytest.mark.asyncio
+    async def test_max_length_states_unit(self, clean_dir: Path) -> None:
+        app = RenamerApp(root=clean_dir)
+        async with app.run_test(size=(120, 40)) as pilot:
+            await pilot.pause()
+            labels = {str(label.content) for label in app.query(Label)}
+            assert ("Max chars:" if sys.platform == "win32" else "Max bytes:") in labels
+            tooltip = app.query_one("#max-length", Input).tooltip
+            assert tooltip is not None
+            assert "UTF-8 bytes (characters on Windows)" in str(tooltip)
+
     @pytest.mark.asyncio
     async def test_quit_keybinding(self, clean_dir: Path) -> None:
         app = RenamerApp(root=clean_dir)